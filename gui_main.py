@@ -8,15 +8,29 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import threading
 import os
+from bisect import bisect_right
 from password_manager import PasswordManager
 from crypto_utils import CryptoUtils
 
+SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+CLIPBOARD_CLEAR_MS = 60_000
+WINDOW_WIDTH, WINDOW_HEIGHT = 1000, 700
+
+# ttk styles live in the Tcl interpreter, so they only need registering once
+_STYLES_INITIALISED = False
+
 
 class PasswordManagerGUI:
+    # Widget options shared by every modern input, built once
+    _INPUT_DEFAULTS = dict(relief='flat', bd=2, bg='#ffffff', fg='#2c3e50', insertbackground='#2c3e50',
+                           highlightthickness=2, highlightbackground='#d3d3d3')
+    _ENTRY_DEFAULTS = {**_INPUT_DEFAULTS, 'font': ('Segoe UI', 12), 'width': 25}
+    _TEXT_DEFAULTS = {**_INPUT_DEFAULTS, 'font': ('Segoe UI', 11), 'height': 4}
+    
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("🔐 Secure Password Manager")
-        self.root.geometry("1000x700")
+        self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         self.root.configure(bg='#1a1a2e')
         self.root.resizable(True, True)
         
@@ -26,6 +40,16 @@ class PasswordManagerGUI:
         # Initialize password manager
         self.password_manager = None
         self.is_authenticated = False
+        self._cred_cache = None
+        self._reset_search_index()
+        self._row_iids = {}
+        self._search_after_id = None
+        self._clip_after_id = None
+        self._dialogs = {}
+        
+        # Top-level screens are built once and swapped with pack/pack_forget
+        self._screens = {}
+        self._current_screen = None
         
         # Style configuration
         self.setup_styles()
@@ -35,43 +59,47 @@ class PasswordManagerGUI:
         
     def center_window(self):
         """Center the window on the screen"""
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
-        self.root.geometry(f'{width}x{height}+{x}+{y}')
+        # The window size is fixed up front, so there is no need to force a layout pass to measure it
+        x = (self.root.winfo_screenwidth() - WINDOW_WIDTH) // 2
+        y = (self.root.winfo_screenheight() - WINDOW_HEIGHT) // 2
+        self.root.geometry(f'{WINDOW_WIDTH}x{WINDOW_HEIGHT}+{x}+{y}')
         
     def create_modern_entry(self, parent, **kwargs):
         """Create a modern styled entry widget"""
-        entry = tk.Entry(parent, 
-                        font=('Segoe UI', 12), 
-                        relief='flat',
-                        bd=2,
-                        bg='#ffffff',
-                        fg='#2c3e50',
-                        insertbackground='#2c3e50',
-                        highlightthickness=2,
-                        highlightcolor=self.colors['accent'] if hasattr(self, 'colors') else '#e94560',
-                        highlightbackground='#d3d3d3',
-                        **kwargs)
-        entry.configure(width=25)
-        return entry
+        return tk.Entry(parent, **{**self._ENTRY_DEFAULTS, 'highlightcolor': self.colors['accent'], **kwargs})
         
     def setup_styles(self):
         """Configure modern ttk styles for better appearance"""
-        style = ttk.Style()
-        style.theme_use('clam')
+        global _STYLES_INITIALISED
         
         # Color scheme
         bg_primary = '#1a1a2e'      # Dark blue background
         bg_secondary = '#16213e'     # Slightly lighter blue
         bg_card = '#0f3460'          # Card background
+        bg_dialog = '#2c3e50'        # Dialog background
         accent_color = '#e94560'     # Red accent
         text_primary = '#ffffff'     # White text
         text_secondary = '#a8a8a8'   # Gray text
         success_color = '#27ae60'    # Green
         
+        # Store colors for custom widgets
+        self.colors = {
+            'bg_primary': bg_primary,
+            'bg_secondary': bg_secondary,
+            'bg_card': bg_card,
+            'bg_dialog': bg_dialog,
+            'accent': accent_color,
+            'text_primary': text_primary,
+            'text_secondary': text_secondary,
+            'success': success_color
+        }
+        
+        if _STYLES_INITIALISED:
+            return
+        
+        style = ttk.Style()
+        style.theme_use('clam')
+        
         # Configure modern styles
         style.configure('Title.TLabel', 
                        font=('Segoe UI', 24, 'bold'), 
@@ -101,6 +129,15 @@ class PasswordManagerGUI:
                        relief='flat',
                        borderwidth=1)
                        
+        # Pop-up dialogs: one frame and label style instead of per-widget colours
+        style.configure('Dialog.TFrame', 
+                       background=bg_dialog)
+                       
+        style.configure('Dialog.TLabel', 
+                       font=('Segoe UI', 11), 
+                       background=bg_dialog, 
+                       foreground=text_primary)
+                       
         # Modern button styles
         style.configure('Primary.TButton',
                        font=('Segoe UI', 11, 'bold'),
@@ -167,30 +204,42 @@ class PasswordManagerGUI:
                        foreground=text_primary,
                        borderwidth=0,
                        relief='flat')
-                       
-        # Store colors for custom widgets
-        self.colors = {
-            'bg_primary': bg_primary,
-            'bg_secondary': bg_secondary,
-            'bg_card': bg_card,
-            'accent': accent_color,
-            'text_primary': text_primary,
-            'text_secondary': text_secondary,
-            'success': success_color
-        }
         
-    def clear_window(self):
-        """Clear all widgets from the window"""
+        _STYLES_INITIALISED = True
+        
+    def _hide_current_screen(self):
+        """Hide the visible screen and close any open dialogs"""
         for widget in self.root.winfo_children():
-            widget.destroy()
+            if isinstance(widget, tk.Toplevel):
+                widget.destroy()
+        self._dialogs = {}
+        if self._current_screen is not None:
+            self._current_screen.pack_forget()
+            self._current_screen = None
             
+    def _show_screen(self, name, builder):
+        """Show a top-level screen, building it the first time it is needed"""
+        self._hide_current_screen()
+        if name not in self._screens:
+            self._screens[name] = builder()
+        self._current_screen = self._screens[name]
+        self._current_screen.pack(expand=True, fill='both')
+        
     def show_auth_screen(self):
         """Show modern authentication/setup screen"""
-        self.clear_window()
-        
+        # Check if this is first time setup
+        if not os.path.exists('.master_hash'):
+            self._show_screen('setup', lambda: self._build_auth_screen(self.show_setup_screen))
+        else:
+            self._show_screen('login', lambda: self._build_auth_screen(self.show_login_screen))
+            self.master_password_entry.delete(0, tk.END)
+            self.login_button.configure(text="Unlock Vault", state='normal')
+            self.master_password_entry.focus()
+            
+    def _build_auth_screen(self, build_card):
+        """Build the authentication screen around a setup or login card"""
         # Create gradient-like background effect
         main_frame = ttk.Frame(self.root, style='Custom.TFrame')
-        main_frame.pack(expand=True, fill='both')
         
         # Create a centered container
         container = ttk.Frame(main_frame, style='Custom.TFrame')
@@ -209,11 +258,8 @@ class PasswordManagerGUI:
         subtitle = ttk.Label(title_frame, text="Your digital vault for secure credential storage", style='Subtitle.TLabel')
         subtitle.pack(pady=(5, 0))
         
-        # Check if this is first time setup
-        if not os.path.exists('.master_hash'):
-            self.show_setup_screen(container)
-        else:
-            self.show_login_screen(container)
+        build_card(container)
+        return main_frame
             
     def show_setup_screen(self, parent):
         """Show modern first-time setup screen"""
@@ -255,9 +301,9 @@ class PasswordManagerGUI:
         security_note.pack(pady=(0, 25))
         
         # Create button
-        create_button = ttk.Button(form_frame, text="Create Master Password", 
-                                 command=self.create_master_password, style='Primary.TButton')
-        create_button.pack(pady=10)
+        self.create_button = ttk.Button(form_frame, text="Create Master Password", 
+                                      command=self.create_master_password, style='Primary.TButton')
+        self.create_button.pack(pady=10)
         
         # Bind Enter key
         self.master_password_entry.bind('<Return>', lambda e: self.confirm_password_entry.focus())
@@ -295,9 +341,9 @@ class PasswordManagerGUI:
         self.master_password_entry.pack(fill='x', pady=(0, 25))
         
         # Login button
-        login_button = ttk.Button(form_frame, text="Unlock Vault", 
-                                command=self.authenticate, style='Primary.TButton')
-        login_button.pack(pady=10)
+        self.login_button = ttk.Button(form_frame, text="Unlock Vault", 
+                                     command=self.authenticate, style='Primary.TButton')
+        self.login_button.pack(pady=10)
         
         # Bind Enter key
         self.master_password_entry.bind('<Return>', lambda e: self.authenticate())
@@ -305,8 +351,22 @@ class PasswordManagerGUI:
         # Focus on entry
         self.master_password_entry.focus()
         
+    def _run_bg(self, fn, on_done):
+        """Run fn on a worker thread and pass (result, error) to on_done on the Tk thread"""
+        def worker():
+            try:
+                result, error = fn(), None
+            except Exception as e:
+                result, error = None, e
+            self.root.after(0, on_done, result, error)
+            
+        threading.Thread(target=worker, daemon=True).start()
+        
     def create_master_password(self):
         """Create master password for first-time setup"""
+        if self.create_button.instate(['disabled']):
+            return
+            
         password = self.master_password_entry.get()
         confirm = self.confirm_password_entry.get()
         
@@ -322,35 +382,66 @@ class PasswordManagerGUI:
         if not self.validate_password_strength(password):
             return
             
-        try:
-            # Initialize password manager and set up master password
-            self.password_manager = PasswordManager()
-            self.password_manager.initialize_master_password(password)
-            self.is_authenticated = True
-            messagebox.showinfo("Success", "Master password created successfully!")
-            self.show_main_screen()
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to create master password: {str(e)}")
+        # Key derivation takes a while, so keep it off the Tk thread
+        def setup():
+            password_manager = PasswordManager()
+            password_manager.initialize_master_password(password)
+            return password_manager
+            
+        self.create_button.configure(text="Creating…", state='disabled')
+        self._run_bg(setup, self._on_setup_done)
+        
+    def _on_setup_done(self, password_manager, error):
+        """Finish create_master_password once the worker is done"""
+        if error is not None:
+            self.create_button.configure(text="Create Master Password", state='normal')
+            messagebox.showerror("Error", f"Failed to create master password: {str(error)}")
+            return
+            
+        self.password_manager = password_manager
+        self.is_authenticated = True
+        messagebox.showinfo("Success", "Master password created successfully!")
+        self.show_main_screen()
+        
+        # First-time setup never comes back once the master hash exists
+        self._screens.pop('setup').destroy()
             
     def authenticate(self):
         """Authenticate user with master password"""
+        if self.login_button.instate(['disabled']):
+            return
+            
         password = self.master_password_entry.get()
         
         if not password:
             messagebox.showerror("Error", "Please enter your master password")
             return
             
-        try:
-            self.password_manager = PasswordManager()
-            if self.password_manager.authenticate(password):
-                self.is_authenticated = True
-                messagebox.showinfo("Success", "Authentication successful!")
-                self.show_main_screen()
+        # Key derivation takes a while, so keep it off the Tk thread
+        def unlock():
+            password_manager = PasswordManager()
+            return password_manager if password_manager.authenticate(password) else None
+            
+        self.login_button.configure(text="Unlocking…", state='disabled')
+        self._run_bg(unlock, self._on_auth_done)
+        
+    def _on_auth_done(self, password_manager, error):
+        """Finish authenticate once the worker is done"""
+        if error is not None or password_manager is None:
+            self.login_button.configure(text="Unlock Vault", state='normal')
+            if error is not None:
+                messagebox.showerror("Error", f"Authentication failed: {str(error)}")
             else:
                 messagebox.showerror("Error", "Invalid master password")
                 self.master_password_entry.delete(0, tk.END)
-        except Exception as e:
-            messagebox.showerror("Error", f"Authentication failed: {str(e)}")
+            return
+            
+        # The login screen outlives the unlock, so its entry must not keep the password
+        self._wipe_entry(self.master_password_entry)
+        self.password_manager = password_manager
+        self.is_authenticated = True
+        messagebox.showinfo("Success", "Authentication successful!")
+        self.show_main_screen()
             
     def validate_password_strength(self, password):
         """Validate password strength"""
@@ -358,10 +449,15 @@ class PasswordManagerGUI:
             messagebox.showerror("Weak Password", "Password must be at least 8 characters long")
             return False
             
-        has_upper = any(c.isupper() for c in password)
-        has_lower = any(c.islower() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_special = any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password)
+        # Single pass over the password, stopping once every class is seen
+        has_upper = has_lower = has_digit = has_special = False
+        for c in password:
+            has_upper |= c.isupper()
+            has_lower |= c.islower()
+            has_digit |= c.isdigit()
+            has_special |= c in SPECIAL_CHARS
+            if has_upper and has_lower and has_digit and has_special:
+                break
         
         if not (has_upper and has_lower and has_digit and has_special):
             messagebox.showwarning("Weak Password", 
@@ -376,11 +472,16 @@ class PasswordManagerGUI:
         
     def show_main_screen(self):
         """Show modern main application screen"""
-        self.clear_window()
+        self._show_screen('main', self._build_main_screen)
+        self.notebook.select(self.credentials_frame)
         
+        # Load credentials
+        self.refresh_credentials()
+        
+    def _build_main_screen(self):
+        """Build the main application screen"""
         # Create main container
         main_container = ttk.Frame(self.root, style='Custom.TFrame')
-        main_container.pack(fill='both', expand=True)
         
         # Header section
         header_frame = ttk.Frame(main_container, style='Custom.TFrame')
@@ -412,7 +513,7 @@ class PasswordManagerGUI:
         content_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Create modern notebook
-        notebook = ttk.Notebook(content_frame, style='Custom.TNotebook')
+        self.notebook = notebook = ttk.Notebook(content_frame, style='Custom.TNotebook')
         notebook.pack(fill='both', expand=True)
         
         # Create tab frames with modern styling
@@ -425,14 +526,35 @@ class PasswordManagerGUI:
         self.settings_frame = ttk.Frame(notebook, style='Custom.TFrame')
         notebook.add(self.settings_frame, text="⚙️  Settings")
         
-        # Setup tabs with modern design
+        # Credentials is shown first; the other tabs are built when first selected
         self.setup_credentials_tab()
-        self.setup_add_tab()
-        self.setup_settings_tab()
-        
-        # Load credentials
-        self.refresh_credentials()
+        self._tab_builders = {
+            str(self.add_frame): self.setup_add_tab,
+            str(self.settings_frame): self.setup_settings_tab,
+        }
+        notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        return main_container
+        
+    def _clear_main_screen(self):
+        """Wipe credential data left in the hidden main screen"""
+        self._reset_search_index()
+        self._clear_tree()
+        self.search_var.set('')
+        self._cancel_search()
+        
+        # The Add New form only exists once its tab has been opened
+        if str(self.add_frame) not in self._tab_builders:
+            for entry in (self.service_entry, self.username_entry, self.url_entry):
+                entry.delete(0, tk.END)
+            self._wipe_entry(self.password_entry)
+            self.notes_text.delete(1.0, tk.END)
         
+    def _on_tab_changed(self, event):
+        """Build a tab's widgets the first time it is selected"""
+        builder = self._tab_builders.pop(str(event.widget.select()), None)
+        if builder:
+            builder()
+            
     def setup_credentials_tab(self):
         """Setup the modern credentials viewing tab"""
         # Main content area
@@ -449,9 +571,11 @@ class PasswordManagerGUI:
         search_input_frame = ttk.Frame(search_card, style='Card.TFrame')
         search_input_frame.pack(fill='x')
         
-        self.search_entry = self.create_modern_entry(search_input_frame)
+        # Search on text changes only, not on every key event (arrows, Shift, ...)
+        self.search_var = tk.StringVar()
+        self.search_entry = self.create_modern_entry(search_input_frame, textvariable=self.search_var)
         self.search_entry.pack(side='left', fill='x', expand=True, padx=(0, 10))
-        self.search_entry.bind('<KeyRelease>', lambda e: self.search_credentials())
+        self.search_var.trace_add('write', self._schedule_search)
         
         search_button = ttk.Button(search_input_frame, text="Search", command=self.search_credentials, style='Secondary.TButton')
         search_button.pack(side='left', padx=(0, 5))
@@ -575,17 +699,7 @@ class PasswordManagerGUI:
         
         # Notes field
         ttk.Label(fields_frame, text="Notes (optional)", style='Custom.TLabel').pack(anchor='w', pady=(0, 5))
-        self.notes_text = tk.Text(fields_frame, 
-                                 font=('Segoe UI', 11), 
-                                 height=4,
-                                 relief='flat',
-                                 bd=2,
-                                 bg='#ffffff',
-                                 fg='#2c3e50',
-                                 insertbackground='#2c3e50',
-                                 highlightthickness=2,
-                                 highlightcolor=self.colors['accent'],
-                                 highlightbackground='#d3d3d3')
+        self.notes_text = tk.Text(fields_frame, **self._TEXT_DEFAULTS, highlightcolor=self.colors['accent'])
         self.notes_text.pack(fill='x', pady=(0, 25))
         
         # Action buttons
@@ -660,55 +774,137 @@ class PasswordManagerGUI:
                               style='Subtitle.TLabel')
         export_note.pack(pady=(10, 0))
         
+    def _credentials(self):
+        """Return the read-only credentials view (no passwords), fetching it once until invalidated"""
+        if self._cred_cache is None:
+            self._cred_cache = self.password_manager.list_credentials_meta()
+        return self._cred_cache
+        
+    def _full_credential(self, service):
+        """Fetch one credential, password included, when it is actually needed"""
+        return self.password_manager.get_all_credentials().get(str(service))
+        
+    def _reset_search_index(self):
+        """Empty the per-row search columns (display strings and their case-folded forms)"""
+        self._services, self._usernames, self._urls = [], [], []
+        self._services_cf, self._usernames_cf, self._urls_cf = [], [], []
+        self._haystack, self._row_starts = b'', []
+        
+    def _clear_tree(self):
+        """Delete every credential row, including rows a search has detached"""
+        if self._row_iids:
+            self.tree.delete(*self._row_iids.values())
+            self._row_iids = {}
+            
     def refresh_credentials(self):
         """Refresh the credentials list"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Clear existing items (one Tcl call for all rows)
+        self._clear_tree()
             
         # Load credentials
         if not self.password_manager:
             return
             
         try:
-            credentials = self.password_manager.get_all_credentials()
-            for service, data in credentials.items():
-                # Extract URL from notes if it exists
-                url = ""
-                notes = data.get('notes', '')
-                if notes and notes.startswith("URL: "):
-                    lines = notes.split('\n', 1)
-                    url = lines[0][5:]  # Remove "URL: " prefix
-                    
-                self.tree.insert('', 'end', values=(service, data.get('username', ''), url))
+            # One list per column, case-folded once here so searches only do substring checks
+            self._reset_search_index()
+            for service, data in self._credentials().items():
+                username, url = data.get('username', ''), data.get('url', '')
+                self._services.append(service)
+                self._usernames.append(username)
+                self._urls.append(url)
+                self._row_iids[service] = self.tree.insert('', 'end', values=(service, username, url))
+            self._services_cf = [service.casefold() for service in self._services]
+            self._usernames_cf = [username.casefold() for username in self._usernames]
+            self._urls_cf = [url.casefold() for url in self._urls]
+            self._build_haystack()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load credentials: {str(e)}")
             
+    def _build_haystack(self):
+        """Join all rows into one NUL-separated UTF-8 buffer, so a search is a C-level bytes.find scan"""
+        rows, offset = [], 0
+        self._row_starts = []
+        for row in zip(self._services_cf, self._usernames_cf, self._urls_cf):
+            # bytes keep a one-byte stride even when a row holds non-ASCII text
+            text = '\x00'.join(row).encode('utf-8', 'replace')
+            rows.append(text)
+            self._row_starts.append(offset)
+            offset += len(text) + 1
+        self._haystack = b'\x00'.join(rows)
+        
+    def _add_row(self, service, username, url):
+        """Append one credential row without reloading the whole list"""
+        self._services.append(service)
+        self._usernames.append(username)
+        self._urls.append(url)
+        self._services_cf.append(service.casefold())
+        self._usernames_cf.append(username.casefold())
+        self._urls_cf.append(url.casefold())
+        self._row_iids[service] = self.tree.insert('', 'end', values=(service, username, url))
+        self._rows_changed()
+        
+    def _update_row(self, service, username, url):
+        """Patch one credential row in place"""
+        i = self._services.index(service)
+        self._usernames[i], self._urls[i] = username, url
+        self._usernames_cf[i], self._urls_cf[i] = username.casefold(), url.casefold()
+        self.tree.item(self._row_iids[service], values=(service, username, url))
+        self._rows_changed()
+        
+    def _remove_row(self, service):
+        """Drop one credential row"""
+        i = self._services.index(service)
+        for column in (self._services, self._usernames, self._urls,
+                       self._services_cf, self._usernames_cf, self._urls_cf):
+            del column[i]
+        self.tree.delete(self._row_iids.pop(service))
+        self._rows_changed()
+        
+    def _rows_changed(self):
+        """Bring the search haystack and the current filter up to date after a row change"""
+        self._cred_cache = None
+        self._build_haystack()
+        if self.search_var.get():
+            self.search_credentials()
+            
+    def _schedule_search(self, *args):
+        """Run the search 150 ms after the last edit of the search box"""
+        self._cancel_search()
+        self._search_after_id = self.root.after(150, self.search_credentials)
+        
+    def _cancel_search(self):
+        """Drop a search that is still waiting to run"""
+        if self._search_after_id:
+            self.root.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        
     def search_credentials(self):
         """Search for credentials"""
+        self._search_after_id = None
         if not self.password_manager:
             return
             
-        search_term = self.search_entry.get().lower()
+        search_term = self.search_var.get().casefold().encode('utf-8', 'replace')
         
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
         try:
-            credentials = self.password_manager.get_all_credentials()
-            for service, data in credentials.items():
-                # Extract URL from notes for search
-                url = ""
-                notes = data.get('notes', '')
-                if notes and notes.startswith("URL: "):
-                    lines = notes.split('\n', 1)
-                    url = lines[0][5:]
-                    
-                if (search_term in service.lower() or 
-                    search_term in data.get('username', '').lower() or
-                    search_term in url.lower()):
-                    self.tree.insert('', 'end', values=(service, data.get('username', ''), url))
+            if search_term:
+                # Jump from hit to hit; after a hit, resume at the next row
+                haystack, starts = self._haystack, self._row_starts
+                matches = []
+                pos = haystack.find(search_term)
+                while pos != -1:
+                    row = bisect_right(starts, pos) - 1
+                    matches.append(row)
+                    if row + 1 == len(starts):
+                        break
+                    pos = haystack.find(search_term, starts[row + 1])
+                services = [self._services[row] for row in matches]
+            else:
+                services = self._services
+                
+            # Swap in the matching rows with one call; the others are detached, not deleted
+            self.tree.set_children('', *(self._row_iids[service] for service in services))
         except Exception as e:
             messagebox.showerror("Error", f"Search failed: {str(e)}")
             
@@ -726,32 +922,89 @@ class PasswordManagerGUI:
         service = item['values'][0]
         
         try:
-            credential = self.password_manager.get_credential(service)
+            credential = self._full_credential(service)
             if credential:
-                # Show password in a dialog
-                password_dialog = tk.Toplevel(self.root)
-                password_dialog.title(f"Password for {service}")
-                password_dialog.geometry("400x200")
-                password_dialog.configure(bg='#2c3e50')
-                
-                ttk.Label(password_dialog, text=f"Service: {service}", style='Custom.TLabel').pack(pady=10)
-                ttk.Label(password_dialog, text=f"Username: {credential.get('username', '')}", style='Custom.TLabel').pack(pady=5)
-                
-                password_frame = ttk.Frame(password_dialog, style='Custom.TFrame')
-                password_frame.pack(pady=10)
-                
-                ttk.Label(password_frame, text="Password:", style='Custom.TLabel').pack(side='left')
-                password_entry = tk.Entry(password_frame, font=('Arial', 12), width=20)
-                password_entry.insert(0, credential['password'])
-                password_entry.config(state='readonly')
-                password_entry.pack(side='left', padx=(5, 0))
-                
-                close_button = ttk.Button(password_dialog, text="Close", command=password_dialog.destroy)
-                close_button.pack(pady=10)
+                # Show password in the (reused) dialog
+                dialog = self._get_dialog('view', self._build_view_dialog)
+                dialog['service'].configure(text=f"Service: {service}")
+                dialog['username'].configure(text=f"Username: {credential.get('username', '')}")
+                dialog['password'].config(state='normal')
+                dialog['password'].delete(0, tk.END)
+                dialog['password'].insert(0, credential['password'])
+                dialog['password'].config(state='readonly')
+                self._show_dialog(dialog, f"Password for {service}")
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to retrieve password: {str(e)}")
             
+    def _get_dialog(self, name, builder):
+        """Return a cached dialog, building it if it is missing or was destroyed"""
+        dialog = self._dialogs.get(name)
+        if dialog is None or not dialog['window'].winfo_exists():
+            dialog = self._dialogs[name] = builder()
+            dialog['window'].protocol("WM_DELETE_WINDOW", lambda: self._close_dialog(name))
+        return dialog
+        
+    def _show_dialog(self, dialog, title):
+        """Bring a cached dialog up with a new title"""
+        dialog['window'].title(title)
+        dialog['window'].deiconify()
+        dialog['window'].lift()
+        
+    def _close_dialog(self, name):
+        """Hide a cached dialog and clear everything shown or typed in it"""
+        dialog = self._dialogs[name]
+        for entry in dialog['entries']:
+            self._wipe_entry(entry)
+        for text in dialog.get('texts', ()):
+            text.delete(1.0, tk.END)
+        dialog['window'].withdraw()
+        
+    @staticmethod
+    def _wipe_entry(entry):
+        """Best-effort wipe: overwrite an entry's text with NULs, then empty it
+
+        Tk may still hold copies elsewhere (Tcl objects, undo data), and any
+        Python str read from the entry is untouched, so this only narrows how
+        long the plaintext lingers.
+        """
+        entry.config(state='normal')
+        length = entry.index(tk.END)
+        if length:
+            entry.delete(0, tk.END)
+            entry.insert(0, '\x00' * length)
+            entry.delete(0, tk.END)
+            
+    def _make_dialog(self, geometry):
+        """Create a dialog window and the styled frame its widgets are packed into"""
+        window = tk.Toplevel(self.root)
+        window.geometry(geometry)
+        body = ttk.Frame(window, style='Dialog.TFrame')
+        body.pack(fill='both', expand=True)
+        return window, body
+        
+    def _build_view_dialog(self):
+        """Build the read-only password dialog"""
+        window, body = self._make_dialog("400x200")
+        
+        service_label = ttk.Label(body, style='Dialog.TLabel')
+        service_label.pack(pady=10)
+        username_label = ttk.Label(body, style='Dialog.TLabel')
+        username_label.pack(pady=5)
+        
+        password_frame = ttk.Frame(body, style='Dialog.TFrame')
+        password_frame.pack(pady=10)
+        
+        ttk.Label(password_frame, text="Password:", style='Dialog.TLabel').pack(side='left')
+        password_entry = tk.Entry(password_frame, font=('Arial', 12), width=20)
+        password_entry.pack(side='left', padx=(5, 0))
+        
+        close_button = ttk.Button(body, text="Close", command=lambda: self._close_dialog('view'))
+        close_button.pack(pady=10)
+        
+        return {'window': window, 'service': service_label, 'username': username_label,
+                'password': password_entry, 'entries': [password_entry]}
+            
     def copy_password(self):
         """Copy password to clipboard"""
         if not self.password_manager:
@@ -766,19 +1019,30 @@ class PasswordManagerGUI:
         service = item['values'][0]
         
         try:
-            credential = self.password_manager.get_credential(service)
+            credential = self._full_credential(service)
             if credential:
                 self.root.clipboard_clear()
                 self.root.clipboard_append(credential['password'])
-                messagebox.showinfo("Success", "Password copied to clipboard")
+                
+                # Don't leave the password on the clipboard indefinitely
+                if self._clip_after_id:
+                    self.root.after_cancel(self._clip_after_id)
+                self._clip_after_id = self.root.after(CLIPBOARD_CLEAR_MS, self._clear_clipboard)
+                messagebox.showinfo("Success",
+                                    f"Password copied to clipboard (cleared in {CLIPBOARD_CLEAR_MS // 1000} seconds)")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to copy password: {str(e)}")
             
+    def _clear_clipboard(self):
+        """Clear a copied password from the clipboard"""
+        self._clip_after_id = None
+        self.root.clipboard_clear()
+        self.root.clipboard_append('')
+        
     def generate_password(self):
         """Generate a strong password"""
         try:
-            crypto_utils = CryptoUtils()
-            password = crypto_utils.generate_secure_password()
+            password = CryptoUtils.generate_secure_password()
             self.password_entry.delete(0, tk.END)
             self.password_entry.insert(0, password)
         except Exception as e:
@@ -800,24 +1064,17 @@ class PasswordManagerGUI:
             return
             
         try:
-            # Combine URL and notes into notes field since API expects only 4 parameters
-            notes_combined = notes
-            if url:
-                notes_combined = f"URL: {url}\n{notes}" if notes else f"URL: {url}"
-                
-            self.password_manager.add_credential(service, username, password, notes_combined)
+            self.password_manager.add_credential(service, username, password, notes, url=url)
+            self._add_row(service, username, url)
             messagebox.showinfo("Success", "Credential added successfully!")
             
             # Clear form
             self.service_entry.delete(0, tk.END)
             self.username_entry.delete(0, tk.END)
-            self.password_entry.delete(0, tk.END)
+            self._wipe_entry(self.password_entry)
             self.url_entry.delete(0, tk.END)
             self.notes_text.delete(1.0, tk.END)
             
-            # Refresh credentials list
-            self.refresh_credentials()
-            
         except Exception as e:
             messagebox.showerror("Error", f"Failed to add credential: {str(e)}")
             
@@ -835,71 +1092,79 @@ class PasswordManagerGUI:
         service = item['values'][0]
         
         try:
-            credential = self.password_manager.get_credential(service)
+            credential = self._full_credential(service)
             if not credential:
                 messagebox.showerror("Error", "Credential not found")
                 return
                 
-            # Create edit dialog
-            edit_dialog = tk.Toplevel(self.root)
-            edit_dialog.title(f"Edit {service}")
-            edit_dialog.geometry("400x300")
-            edit_dialog.configure(bg='#2c3e50')
-            
-            # Form fields
-            ttk.Label(edit_dialog, text="Username/Email:", style='Custom.TLabel').pack(pady=5)
-            username_entry = tk.Entry(edit_dialog, font=('Arial', 10), width=30)
-            username_entry.insert(0, credential.get('username', ''))
-            username_entry.pack(pady=5)
-            
-            ttk.Label(edit_dialog, text="Password:", style='Custom.TLabel').pack(pady=5)
-            password_entry = tk.Entry(edit_dialog, show='*', font=('Arial', 10), width=30)
-            password_entry.insert(0, credential.get('password', ''))
-            password_entry.pack(pady=5)
-            
-            ttk.Label(edit_dialog, text="URL:", style='Custom.TLabel').pack(pady=5)
-            url_entry = tk.Entry(edit_dialog, font=('Arial', 10), width=30)
-            url_entry.insert(0, credential.get('url', ''))
-            url_entry.pack(pady=5)
-            
-            ttk.Label(edit_dialog, text="Notes:", style='Custom.TLabel').pack(pady=5)
-            notes_text = tk.Text(edit_dialog, font=('Arial', 10), width=30, height=3)
-            notes_text.insert(1.0, credential.get('notes', ''))
-            notes_text.pack(pady=5)
-            
-            def save_changes():
-                new_username = username_entry.get().strip()
-                new_password = password_entry.get()
-                new_url = url_entry.get().strip()
-                new_notes = notes_text.get(1.0, tk.END).strip()
-                
-                if not new_username or not new_password:
-                    messagebox.showerror("Error", "Username and password are required")
-                    return
-                    
-                if not self.password_manager:
-                    messagebox.showerror("Error", "Not authenticated")
-                    return
-                    
-                try:
-                    # Combine URL and notes like in add_credential
-                    notes_combined = new_notes
-                    if new_url:
-                        notes_combined = f"URL: {new_url}\n{new_notes}" if new_notes else f"URL: {new_url}"
-                    
-                    self.password_manager.update_credential(service, username=new_username, password=new_password, notes=notes_combined)
-                    messagebox.showinfo("Success", "Credential updated successfully!")
-                    edit_dialog.destroy()
-                    self.refresh_credentials()
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to update credential: {str(e)}")
-                    
-            save_button = ttk.Button(edit_dialog, text="Save Changes", command=save_changes)
-            save_button.pack(pady=10)
+            # Fill the (reused) edit dialog
+            dialog = self._get_dialog('edit', self._build_edit_dialog)
+            self._close_dialog('edit')
+            dialog['service_name'] = str(service)
+            dialog['username'].insert(0, credential.get('username', ''))
+            dialog['password'].insert(0, credential.get('password', ''))
+            dialog['url'].insert(0, credential.get('url', ''))
+            dialog['notes'].insert(1.0, credential.get('notes', ''))
+            self._show_dialog(dialog, f"Edit {service}")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load credential: {str(e)}")
             
+    def _build_edit_dialog(self):
+        """Build the edit-credential dialog"""
+        window, body = self._make_dialog("400x300")
+        
+        # Form fields
+        ttk.Label(body, text="Username/Email:", style='Dialog.TLabel').pack(pady=5)
+        username_entry = tk.Entry(body, font=('Arial', 10), width=30)
+        username_entry.pack(pady=5)
+        
+        ttk.Label(body, text="Password:", style='Dialog.TLabel').pack(pady=5)
+        password_entry = tk.Entry(body, show='*', font=('Arial', 10), width=30)
+        password_entry.pack(pady=5)
+        
+        ttk.Label(body, text="URL:", style='Dialog.TLabel').pack(pady=5)
+        url_entry = tk.Entry(body, font=('Arial', 10), width=30)
+        url_entry.pack(pady=5)
+        
+        ttk.Label(body, text="Notes:", style='Dialog.TLabel').pack(pady=5)
+        notes_text = tk.Text(body, font=('Arial', 10), width=30, height=3)
+        notes_text.pack(pady=5)
+        
+        save_button = ttk.Button(body, text="Save Changes", command=self.save_changes)
+        save_button.pack(pady=10)
+        
+        return {'window': window, 'username': username_entry, 'password': password_entry, 'url': url_entry,
+                'notes': notes_text, 'entries': [username_entry, password_entry, url_entry], 'texts': [notes_text]}
+        
+    def save_changes(self):
+        """Save the credential being edited in the edit dialog"""
+        dialog = self._dialogs['edit']
+        new_username = dialog['username'].get().strip()
+        new_password = dialog['password'].get()
+        new_url = dialog['url'].get().strip()
+        new_notes = dialog['notes'].get(1.0, tk.END).strip()
+        
+        if not new_username or not new_password:
+            messagebox.showerror("Error", "Username and password are required")
+            return
+            
+        if not self.password_manager:
+            messagebox.showerror("Error", "Not authenticated")
+            return
+            
+        try:
+            service = dialog['service_name']
+            if not self.password_manager.update_credential(service, username=new_username,
+                                                           password=new_password, notes=new_notes, url=new_url):
+                messagebox.showerror("Error", "Credential not found")
+                return
+            self._update_row(service, new_username, new_url)
+            messagebox.showinfo("Success", "Credential updated successfully!")
+            self._close_dialog('edit')
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to update credential: {str(e)}")
+            
     def delete_credential(self):
         """Delete selected credential"""
         if not self.password_manager:
@@ -911,67 +1176,109 @@ class PasswordManagerGUI:
             return
             
         item = self.tree.item(selection[0])
-        service = item['values'][0]
+        service = str(item['values'][0])
         
         result = messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete the credential for '{service}'?")
         if result:
             try:
-                self.password_manager.delete_credential(service)
+                if not self.password_manager.delete_credential(service):
+                    messagebox.showerror("Error", "Credential not found")
+                    return
+                self._remove_row(service)
                 messagebox.showinfo("Success", "Credential deleted successfully!")
-                self.refresh_credentials()
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to delete credential: {str(e)}")
                 
     def change_master_password(self):
         """Change master password"""
-        # Create dialog
-        dialog = tk.Toplevel(self.root)
-        dialog.title("Change Master Password")
-        dialog.geometry("300x200")
-        dialog.configure(bg='#2c3e50')
-        
-        ttk.Label(dialog, text="Current Password:", style='Custom.TLabel').pack(pady=5)
-        current_entry = tk.Entry(dialog, show='*', font=('Arial', 10), width=25)
+        dialog = self._get_dialog('change_password', self._build_change_password_dialog)
+        self._show_dialog(dialog, "Change Master Password")
+        dialog['current'].focus()
+        
+    def _build_change_password_dialog(self):
+        """Build the change-master-password dialog"""
+        window, body = self._make_dialog("300x240")
+        
+        ttk.Label(body, text="Current Password:", style='Dialog.TLabel').pack(pady=5)
+        current_entry = tk.Entry(body, show='*', font=('Arial', 10), width=25)
         current_entry.pack(pady=5)
         
-        ttk.Label(dialog, text="New Password:", style='Custom.TLabel').pack(pady=5)
-        new_entry = tk.Entry(dialog, show='*', font=('Arial', 10), width=25)
+        ttk.Label(body, text="New Password:", style='Dialog.TLabel').pack(pady=5)
+        new_entry = tk.Entry(body, show='*', font=('Arial', 10), width=25)
         new_entry.pack(pady=5)
         
-        ttk.Label(dialog, text="Confirm New Password:", style='Custom.TLabel').pack(pady=5)
-        confirm_entry = tk.Entry(dialog, show='*', font=('Arial', 10), width=25)
+        ttk.Label(body, text="Confirm New Password:", style='Dialog.TLabel').pack(pady=5)
+        confirm_entry = tk.Entry(body, show='*', font=('Arial', 10), width=25)
         confirm_entry.pack(pady=5)
         
-        def change_password():
-            current = current_entry.get()
-            new_password = new_entry.get()
-            confirm = confirm_entry.get()
-            
-            if not current or not new_password:
-                messagebox.showerror("Error", "All fields are required")
-                return
-                
-            if new_password != confirm:
-                messagebox.showerror("Error", "New passwords do not match")
-                return
-                
-            if not self.validate_password_strength(new_password):
-                return
-                
-            if not self.password_manager:
-                messagebox.showerror("Error", "Not authenticated")
-                return
-                
-            try:
-                self.password_manager.change_master_password(current, new_password)
-                messagebox.showinfo("Success", "Master password changed successfully!")
-                dialog.destroy()
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to change password: {str(e)}")
-                
-        change_button = ttk.Button(dialog, text="Change Password", command=change_password)
+        change_button = ttk.Button(body, text="Change Password", command=self.change_password)
         change_button.pack(pady=10)
         
+        # Packed only while the vault is being re-encrypted
+        progress = ttk.Progressbar(body, mode='indeterminate')
+        
+        return {'window': window, 'current': current_entry, 'new': new_entry, 'confirm': confirm_entry,
+                'button': change_button, 'progress': progress,
+                'entries': [current_entry, new_entry, confirm_entry]}
+        
+    def change_password(self):
+        """Apply the master password change entered in the dialog"""
+        dialog = self._dialogs['change_password']
+        if dialog['button'].instate(['disabled']):
+            return
+            
+        current = dialog['current'].get()
+        new_password = dialog['new'].get()
+        confirm = dialog['confirm'].get()
+        
+        if not current or not new_password:
+            messagebox.showerror("Error", "All fields are required")
+            return
+            
+        if new_password != confirm:
+            messagebox.showerror("Error", "New passwords do not match")
+            return
+            
+        if not self.validate_password_strength(new_password):
+            return
+            
+        if not self.password_manager:
+            messagebox.showerror("Error", "Not authenticated")
+            return
+            
+        # Re-deriving the key and re-encrypting the vault takes a while, so keep it off the Tk thread;
+        # the grab stops the main window from saving credentials while the worker rewrites the vault
+        password_manager = self.password_manager
+        dialog['button'].configure(text="Changing…", state='disabled')
+        dialog['progress'].pack(fill='x', padx=20, pady=(0, 10))
+        dialog['progress'].start(10)
+        dialog['window'].grab_set()
+        self._run_bg(lambda: password_manager.change_master_password(current, new_password),
+                     self._on_change_password_done)
+        
+    def _on_change_password_done(self, changed, error):
+        """Finish change_password once the worker is done"""
+        dialog = self._dialogs.get('change_password')
+        if dialog is None or not dialog['window'].winfo_exists():
+            return  # logged out while the worker ran
+            
+        dialog['window'].grab_release()
+        dialog['progress'].stop()
+        dialog['progress'].pack_forget()
+        dialog['button'].configure(text="Change Password", state='normal')
+        
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to change password: {str(error)}")
+            return
+            
+        if not changed:
+            messagebox.showerror("Error", "Current password is incorrect")
+            return
+            
+        self._cred_cache = None
+        messagebox.showinfo("Success", "Master password changed successfully!")
+        self._close_dialog('change_password')
+        
     def export_credentials(self):
         """Export credentials to encrypted file"""
         if not self.password_manager:
@@ -987,17 +1294,31 @@ class PasswordManagerGUI:
         )
         
         if filename:
-            try:
-                self.password_manager.export_credentials(filename)
-                messagebox.showinfo("Success", f"Credentials exported to {filename}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to export credentials: {str(e)}")
+            # Encrypting and writing the backup happens off the Tk thread
+            password_manager = self.password_manager
+            self._run_bg(lambda: password_manager.export_credentials(filename),
+                         lambda exported, error: self._on_export_done(filename, exported, error))
+                
+    def _on_export_done(self, filename, exported, error):
+        """Report the result of export_credentials once the worker is done"""
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to export credentials: {str(error)}")
+        elif not exported:
+            messagebox.showwarning("Export", "There are no credentials to export")
+        else:
+            messagebox.showinfo("Success", f"Credentials exported to {filename}")
                 
     def logout(self):
         """Logout and return to authentication screen"""
+        CryptoUtils.clear_key_cache()
+        if self._clip_after_id:
+            self.root.after_cancel(self._clip_after_id)
+            self._clear_clipboard()
         self.password_manager = None
         self.is_authenticated = False
+        self._cred_cache = None
         self.show_auth_screen()
+        self._clear_main_screen()
         
     def run(self):
         """Start the GUI application"""
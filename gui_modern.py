@@ -5,110 +5,117 @@ Futuristic Password Manager - Ultra Modern Aesthetic GUI
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+from tkinter import font as tkfont
 import os
-import random
-import string
 import math
 import time
-from password_manager import PasswordManager
+import functools
+import threading
 
+# How long a copied password stays on the clipboard
+CLIPBOARD_CLEAR_MS = 30_000
+# How long a status bar message stays up
+STATUS_CLEAR_MS = 3000
 
-class FuturisticButton(tk.Frame):
+# Named fonts shared by every widget; created on first use, once a Tk root exists
+_FONT_SPECS = {
+    "label": ("Consolas", 10, "bold"),
+    "entry": ("Consolas", 12, "normal"),
+    "button_small": ("Consolas", 10, "bold"),
+    "button_normal": ("Consolas", 11, "bold"),
+    "button_large": ("Consolas", 12, "bold"),
+    "dialog_header": ("Consolas", 14, "bold"),
+}
+_FONTS = {}
+
+
+def _font(name):
+    """Return the shared Font for a _FONT_SPECS key, building it only once"""
+    font = _FONTS.get(name)
+    if font is None:
+        family, size, weight = _FONT_SPECS[name]
+        font = _FONTS[name] = tkfont.Font(family=family, size=size, weight=weight)
+    return font
+
+
+class FuturisticButton(ttk.Button):
     """Futuristic button with neon glow effects"""
     
+    # Futuristic color schemes
+    STYLES = {
+        "primary": {"bg": "#0F172A", "hover": "#1E293B", "accent": "#00D4FF", "text": "white"},
+        "success": {"bg": "#064E3B", "hover": "#065F46", "accent": "#10F2C5", "text": "white"},
+        "warning": {"bg": "#451A03", "hover": "#78350F", "accent": "#FFC107", "text": "white"},
+        "danger": {"bg": "#450A0A", "hover": "#7F1D1D", "accent": "#FF073A", "text": "white"},
+        "ghost": {"bg": "#111827", "hover": "#1F2937", "accent": "#6366F1", "text": "#E5E7EB"},
+        "neon": {"bg": "#000000", "hover": "#111111", "accent": "#00FF41", "text": "#00FF41"}
+    }
+    
+    SIZES = {
+        "small": {"font": "button_small", "padx": 20, "pady": 10},
+        "normal": {"font": "button_normal", "padx": 28, "pady": 14},
+        "large": {"font": "button_large", "padx": 36, "pady": 18}
+    }
+    
+    # (style, size) as passed by callers -> registered ttk style name
+    _ttk_styles = {}
+    
     def __init__(self, parent, text, command=None, style="primary", size="normal", **kwargs):
-        super().__init__(parent, bg=parent.cget('bg'))
-        
-        self.command = command
-        self.is_hovered = False
-        self.animation_id = None
-        
-        # Futuristic color schemes
-        styles = {
-            "primary": {"bg": "#0F172A", "hover": "#1E293B", "accent": "#00D4FF", "text": "white"},
-            "success": {"bg": "#064E3B", "hover": "#065F46", "accent": "#10F2C5", "text": "white"},
-            "warning": {"bg": "#451A03", "hover": "#78350F", "accent": "#FFC107", "text": "white"},
-            "danger": {"bg": "#450A0A", "hover": "#7F1D1D", "accent": "#FF073A", "text": "white"},
-            "ghost": {"bg": "#111827", "hover": "#1F2937", "accent": "#6366F1", "text": "#E5E7EB"},
-            "neon": {"bg": "#000000", "hover": "#111111", "accent": "#00FF41", "text": "#00FF41"}
-        }
-        
-        sizes = {
-            "small": {"font": ("Consolas", 10, "bold"), "padx": 20, "pady": 10},
-            "normal": {"font": ("Consolas", 11, "bold"), "padx": 28, "pady": 14},
-            "large": {"font": ("Consolas", 12, "bold"), "padx": 36, "pady": 18}
-        }
-        
-        self.style_config = styles.get(style, styles["primary"])
-        self.size_config = sizes.get(size, sizes["normal"])
-        
-        # Outer glow frame
-        self.glow_frame = tk.Frame(
-            self,
-            bg=self.style_config["accent"],
-            relief="flat",
-            bd=0
-        )
-        self.glow_frame.pack(padx=2, pady=2)
-        
-        # Main button
-        self.button = tk.Label(
-            self.glow_frame,
-            text=text,
-            font=self.size_config["font"],
-            bg=self.style_config["bg"],
-            fg=self.style_config["text"],
-            cursor="hand2",
-            padx=self.size_config["padx"],
-            pady=self.size_config["pady"],
-            relief="flat",
-            bd=0
-        )
-        self.button.pack(padx=1, pady=1)
-        
-        # Initially hide glow
-        self.glow_frame.configure(bg=self.style_config["bg"])
-        
-        # Bind events
-        self.button.bind("<Button-1>", self._on_click)
-        self.button.bind("<Enter>", self._on_enter)
-        self.button.bind("<Leave>", self._on_leave)
-        
-    def _on_click(self, event):
-        if self.command:
-            # Pulse animation
-            self._pulse_animation()
-            self.command()
-            
-    def _on_enter(self, event):
-        self.is_hovered = True
-        self.button.configure(bg=self.style_config["hover"])
-        self._start_glow()
-        
-    def _on_leave(self, event):
-        self.is_hovered = False
-        self.button.configure(bg=self.style_config["bg"])
-        self._stop_glow()
-        
-    def _start_glow(self):
-        self.glow_frame.configure(bg=self.style_config["accent"])
-        
-    def _stop_glow(self):
-        self.glow_frame.configure(bg=self.style_config["bg"])
-        
-    def _pulse_animation(self):
-        # Quick pulse effect
-        original_bg = self.button.cget("bg")
-        self.button.configure(bg=self.style_config["accent"])
-        self.after(150, lambda: self.button.configure(bg=original_bg))
+        ttk_style = self._ttk_styles.get((style, size)) or self._register_style(style, size)
+        kwargs.setdefault("cursor", "hand2")
+        super().__init__(parent, text=text, command=command, style=ttk_style, **kwargs)
+        
+    @classmethod
+    def _register_style(cls, style, size):
+        """Register the ttk style for a color scheme and size once; hover glow and
+        click pulse are state maps, so Tk swaps the colors without Python callbacks"""
+        key = (style, size)
+        style = style if style in cls.STYLES else "primary"
+        size = size if size in cls.SIZES else "normal"
+        name = f"{style.title()}{size.title()}.Cyber.TButton"
+        if name not in cls._ttk_styles.values():
+            colors, metrics = cls.STYLES[style], cls.SIZES[size]
+            ttk_style = ttk.Style()
+            ttk_style.configure(
+                name,
+                font=_font(metrics["font"]),
+                background=colors["bg"],
+                foreground=colors["text"],
+                bordercolor=colors["bg"],
+                lightcolor=colors["bg"],
+                darkcolor=colors["bg"],
+                focuscolor=colors["bg"],
+                borderwidth=2,
+                relief="flat",
+                padding=(metrics["padx"], metrics["pady"])
+            )
+            ttk_style.map(
+                name,
+                background=[("pressed", colors["accent"]), ("active", colors["hover"])],
+                bordercolor=[("active", colors["accent"])],
+                lightcolor=[("active", colors["accent"])],
+                darkcolor=[("active", colors["accent"])]
+            )
+        cls._ttk_styles[key] = name
+        return name
 
 
 class CyberInput(tk.Frame):
     """Futuristic cyber-styled input field"""
     
-    def __init__(self, parent, label="", placeholder="", is_password=False, **kwargs):
+    # Entry widget (font is the shared "entry" Font)
+    ENTRY_OPTIONS = {
+        "bg": "#0F172A",
+        "fg": "#E2E8F0",
+        "relief": "flat",
+        "bd": 0,
+        "insertbackground": "#00D4FF"
+    }
+    
+    def __init__(self, parent, label="", placeholder="", is_password=False, textvariable=None, **kwargs):
         super().__init__(parent, bg=parent.cget('bg'))
         
+        self.var = textvariable or tk.StringVar(self)
         self.label_text = label
         self.placeholder_text = placeholder
         self.is_password = is_password
@@ -120,7 +127,7 @@ class CyberInput(tk.Frame):
         self.label = tk.Label(
             label_frame,
             text=f"▶ {label}",
-            font=("Consolas", 10, "bold"),
+            font=_font("label"),
             bg=parent.cget('bg'),
             fg="#00D4FF",
             anchor="w"
@@ -143,20 +150,8 @@ class CyberInput(tk.Frame):
         )
         self.container.pack(fill="x", ipady=4)
         
-        # Entry widget
-        entry_config = {
-            "font": ("Consolas", 12),
-            "bg": "#0F172A",
-            "fg": "#E2E8F0",
-            "relief": "flat",
-            "bd": 0,
-            "insertbackground": "#00D4FF"
-        }
-        
-        if is_password:
-            entry_config["show"] = "●"
-            
-        self.entry = tk.Entry(self.container, **entry_config)
+        self.entry = tk.Entry(self.container, textvariable=self.var, show="●" if is_password else "",
+                              font=_font("entry"), **self.ENTRY_OPTIONS)
         self.entry.pack(fill="x", padx=16, pady=8)
         
         # Set placeholder
@@ -214,18 +209,59 @@ class CyberInput(tk.Frame):
         return self.entry.bind(sequence, func, add)
 
 
+# Gradient positions are quantised to this many steps so their colours can be cached
+_RAMP_RESOLUTION = 1000
+
+
+@functools.lru_cache(maxsize=_RAMP_RESOLUTION)
+def _ramp_color(step):
+    """Return the '#rrggbb' colour at position step / _RAMP_RESOLUTION of the holographic ramp"""
+    ratio = step / _RAMP_RESOLUTION
+    
+    # Cyber colors: deep blue to cyan to purple
+    if ratio < 0.5:
+        r = int(15 + (0 - 15) * (ratio * 2))
+        g = int(23 + (212 - 23) * (ratio * 2))
+        b = int(42 + (255 - 42) * (ratio * 2))
+    else:
+        r = int(0 + (139 - 0) * ((ratio - 0.5) * 2))
+        g = int(212 + (69 - 212) * ((ratio - 0.5) * 2))
+        b = int(255 + (255 - 255) * ((ratio - 0.5) * 2))
+        
+    return f"#{max(0, min(255, r)):02x}{max(0, min(255, g)):02x}{max(0, min(255, b)):02x}"
+
+
 class HolographicHeader(tk.Canvas):
     """Futuristic holographic header with animated effects"""
     
+    # CYBER_VAULT_STATIC=1 draws the header once and never animates it
+    STATIC = bool(os.environ.get('CYBER_VAULT_STATIC'))
+    # Recolouring a header this wide every tick costs more than the effect is worth
+    MAX_ANIMATED_SCREEN_PIXELS = 4_000_000
+    
     def __init__(self, parent, height=180, **kwargs):
         super().__init__(parent, height=height, highlightthickness=0, bg="#000000", **kwargs)
         self.height = height
         self.animation_active = False
+        self.animation_id = None
+        self.gradient_items = []
+        self.gradient_colors = None
+        self.grid_image = None
         self.bind('<Configure>', self._draw_header)
-        self.after(100, self._start_animation)
+        # No point animating while the header is not on screen, and a destroyed
+        # header must not leave its after() chain running. <Map>/<Unmap> only reach
+        # the window actually (un)mapped (the toplevel on iconify/withdraw, the screen
+        # frame on show_screen), so watch them all through the toplevel's bind tag
+        toplevel = self.winfo_toplevel()
+        toplevel.bind('<Map>', self._on_map_change, add='+')
+        toplevel.bind('<Unmap>', self._on_map_change, add='+')
+        self.bind('<Destroy>', self._stop_animation)
+        self.animation_id = self.after(100, self._start_animation)
         
     def _draw_header(self, event=None):
         self.delete("all")
+        self.gradient_items = []
+        self.gradient_colors = None
         width = self.winfo_width()
         height = self.height
         
@@ -242,36 +278,31 @@ class HolographicHeader(tk.Canvas):
         self._draw_neon_borders(width, height)
         
     def _draw_cyber_grid(self, width, height):
-        # Grid pattern
+        # Grid pattern, painted into an image once per size so it is a single canvas item.
+        # One grid cell (line along its top and left edge on the black header background)
+        # is tiled across the whole image by a single put.
         grid_size = 20
-        for x in range(0, width, grid_size):
-            self.create_line(x, 0, x, height, fill="#1E293B", width=1)
-        for y in range(0, height, grid_size):
-            self.create_line(0, y, width, y, fill="#1E293B", width=1)
+        line, blank = "#1E293B", "#000000"
+        cell = [(line,) * grid_size] + [(line,) + (blank,) * (grid_size - 1)] * (grid_size - 1)
+        image = tk.PhotoImage(width=width, height=height)
+        image.put(tuple(cell), to=(0, 0, width, height))
+        self.grid_image = image
+        self.create_image(0, 0, image=image, anchor="nw")
             
+    def _gradient_ramp(self, steps):
+        # Color animation based on time
+        shift = math.sin(time.time() * 2) * 0.1
+        return [_ramp_color(int((i / steps + shift) % 1 * _RAMP_RESOLUTION)) for i in range(steps)]
+        
     def _draw_holographic_gradient(self, width, height):
-        # Animated holographic effect
+        # Animated holographic effect; the bands are recoloured in place by _animate
         steps = 50
-        for i in range(steps):
+        self.gradient_colors = self._gradient_ramp(steps)
+        for i, color in enumerate(self.gradient_colors):
             y1 = (height * i) // steps
             y2 = (height * (i + 1)) // steps
-            
-            # Color animation based on time
-            t = time.time() * 2
-            ratio = (i / steps + math.sin(t) * 0.1) % 1
-            
-            # Cyber colors: deep blue to cyan to purple
-            if ratio < 0.5:
-                r = int(15 + (0 - 15) * (ratio * 2))
-                g = int(23 + (212 - 23) * (ratio * 2))
-                b = int(42 + (255 - 42) * (ratio * 2))
-            else:
-                r = int(0 + (139 - 0) * ((ratio - 0.5) * 2))
-                g = int(212 + (69 - 212) * ((ratio - 0.5) * 2))
-                b = int(255 + (255 - 255) * ((ratio - 0.5) * 2))
-                
-            color = f"#{max(0, min(255, r)):02x}{max(0, min(255, g)):02x}{max(0, min(255, b)):02x}"
-            self.create_rectangle(0, y1, width, y2, fill=color, outline="", stipple="gray50")
+            self.gradient_items.append(
+                self.create_rectangle(0, y1, width, y2, fill=color, outline="", stipple="gray50"))
             
     def _draw_neon_borders(self, width, height):
         # Top and bottom neon lines
@@ -283,15 +314,53 @@ class HolographicHeader(tk.Canvas):
         self.create_line(0, 0, corner_size, 0, fill="#00FF41", width=5)
         self.create_line(0, 0, 0, corner_size, fill="#00FF41", width=5)
         
+    def _animation_allowed(self):
+        return (not self.STATIC and
+                self.winfo_screenwidth() * self.winfo_screenheight() <= self.MAX_ANIMATED_SCREEN_PIXELS)
+        
+    def _on_map_change(self, event):
+        """Pause or resume when this header or one of its ancestors is mapped or unmapped"""
+        path = str(event.widget)
+        if not self.winfo_exists() or (path != '.' and path != str(self) and
+                                       not str(self).startswith(path + '.')):
+            return
+        if self.winfo_viewable():
+            self._start_animation()
+        else:
+            self._stop_animation()
+        
     def _start_animation(self):
-        if not self.animation_active:
+        if self.animation_active:
+            return
+        # Drop a pending delayed start so there is only ever one after() callback
+        if self.animation_id:
+            self.after_cancel(self.animation_id)
+            self.animation_id = None
+        if self._animation_allowed():
             self.animation_active = True
             self._animate()
             
+    def _stop_animation(self, event=None):
+        self.animation_active = False
+        if self.animation_id:
+            self.after_cancel(self.animation_id)
+            self.animation_id = None
+            
     def _animate(self):
-        if self.animation_active:
-            self._draw_header()
-            self.after(100, self._animate)
+        if self.animation_active and not self.winfo_viewable():
+            # Hidden without an event reaching us; _on_map_change resumes it
+            self._stop_animation()
+        elif self.animation_active:
+            # Only the gradient changes over time: recolour the bands that
+            # changed instead of redrawing the grid and borders every tick
+            if self.gradient_items:
+                colors = self._gradient_ramp(len(self.gradient_items))
+                if colors != self.gradient_colors:
+                    for item, old, new in zip(self.gradient_items, self.gradient_colors, colors):
+                        if old != new:
+                            self.itemconfigure(item, fill=new)
+                    self.gradient_colors = colors
+            self.animation_id = self.after(100, self._animate)
 
 
 class CyberCard(tk.Frame):
@@ -328,6 +397,21 @@ class PasswordManagerGUI:
         self.password_manager = None
         self.is_authenticated = False
         self.current_credentials = {}
+        self.search_index = []
+        self.search_after_id = None
+        self.clip_after_id = None
+        self.status_after_id = None
+        self.shown_query = None
+        self.credential_dialog = None
+        self.screens = {}
+        self.current_screen = None
+        # Status bar for success messages; packed first so screens fill the space above it
+        self.status_label = tk.Label(self.root, text="", font=("Consolas", 10, "bold"),
+                                     bg="#0F172A", fg="#00FF41", anchor="w", padx=12, pady=4)
+        self.status_label.pack(side="bottom", fill="x")
+        self.row_menu = tk.Menu(self.root, tearoff=0, bg="#0F172A", fg="#E2E8F0",
+                                activebackground="#1E293B", activeforeground="#00D4FF",
+                                font=("Consolas", 10, "bold"))
         
         # Show initial screen
         self.show_cyber_auth_screen()
@@ -352,19 +436,43 @@ class PasswordManagerGUI:
                        darkcolor="#1E293B",
                        lightcolor="#334155")
         
-    def clear_window(self):
-        """Clear all widgets"""
+    def show_screen(self, name, builder):
+        """Swap in a screen frame, building it the first time; screens persist across logout/login"""
+        # Close any open dialogs
         for widget in self.root.winfo_children():
-            widget.destroy()
+            if isinstance(widget, tk.Toplevel):
+                widget.destroy()
+                
+        if self.current_screen in self.screens:
+            self.screens[self.current_screen].pack_forget()
+            
+        frame = self.screens.get(name)
+        if frame is None:
+            frame = self.screens[name] = tk.Frame(self.root, bg="#000000")
+            builder(frame)
+        frame.pack(fill="both", expand=True)
+        self.current_screen = name
+        
+    def drop_screen(self, name):
+        """Destroy a screen that will not be shown again"""
+        frame = self.screens.pop(name, None)
+        if frame is not None:
+            frame.destroy()
             
     def show_cyber_auth_screen(self):
         """Show futuristic authentication screen"""
-        self.clear_window()
-        
-        # Main container
-        main_frame = tk.Frame(self.root, bg="#000000")
-        main_frame.pack(fill="both", expand=True)
-        
+        # Determine which form to show
+        if not os.path.exists('.master_hash'):
+            self.show_screen('setup', lambda frame: self.build_cyber_auth_screen(frame, self.show_cyber_setup_form))
+        else:
+            reused = 'login' in self.screens
+            self.show_screen('login', lambda frame: self.build_cyber_auth_screen(frame, self.show_cyber_login_form))
+            if reused:
+                self.master_password_input.clear()
+                self.master_password_input.focus()
+                
+    def build_cyber_auth_screen(self, main_frame, build_form):
+        """Build the authentication screen around the setup or login form"""
         # Holographic header
         header = HolographicHeader(main_frame, height=200)
         header.pack(fill="x")
@@ -386,15 +494,14 @@ class PasswordManagerGUI:
             "╚═══════════════════════════╝"
         ]
         
-        for line in logo_lines:
-            logo_label = tk.Label(
-                logo_container,
-                text=line,
-                font=("Consolas", 10, "bold"),
-                bg="#000000",
-                fg="#00D4FF"
-            )
-            logo_label.pack()
+        logo_label = tk.Label(
+            logo_container,
+            text="\n".join(logo_lines),
+            font=("Consolas", 10, "bold"),
+            bg="#000000",
+            fg="#00D4FF"
+        )
+        logo_label.pack()
             
         # Content area
         content_frame = tk.Frame(main_frame, bg="#000000")
@@ -404,11 +511,7 @@ class PasswordManagerGUI:
         auth_card = CyberCard(content_frame)
         auth_card.pack(expand=True, fill="both", ipadx=50, ipady=30)
         
-        # Determine which form to show
-        if not os.path.exists('.master_hash'):
-            self.show_cyber_setup_form(auth_card)
-        else:
-            self.show_cyber_login_form(auth_card)
+        build_form(auth_card)
             
     def show_cyber_setup_form(self, parent):
         """Show futuristic setup form"""
@@ -503,14 +606,14 @@ class PasswordManagerGUI:
         security_desc.pack(pady=(5, 0))
         
         # Initialize button
-        init_btn = FuturisticButton(
+        self.init_button = FuturisticButton(
             form_frame,
             text="◢ INITIALIZE VAULT ◣",
             command=self.create_master_password,
             style="neon",
             size="large"
         )
-        init_btn.pack(pady=20)
+        self.init_button.pack(pady=20)
         
         # Key bindings
         self.master_password_input.bind('<Return>', lambda e: self.confirm_password_input.focus())
@@ -581,14 +684,14 @@ class PasswordManagerGUI:
         self.master_password_input.pack(fill="x", pady=(0, 30))
         
         # Access button
-        access_btn = FuturisticButton(
+        self.access_button = FuturisticButton(
             form_frame,
             text="◢ ACCESS VAULT ◣",
             command=self.authenticate,
             style="neon",
             size="large"
         )
-        access_btn.pack(pady=20)
+        self.access_button.pack(pady=20)
         
         # Key binding
         self.master_password_input.bind('<Return>', lambda e: self.authenticate())
@@ -596,8 +699,22 @@ class PasswordManagerGUI:
         # Focus
         self.master_password_input.focus()
         
+    def _run_bg(self, fn, on_done):
+        """Run fn on a worker thread and pass (result, error) to on_done on the Tk thread"""
+        def worker():
+            try:
+                result, error = fn(), None
+            except Exception as e:
+                result, error = None, e
+            self.root.after(0, on_done, result, error)
+            
+        threading.Thread(target=worker, daemon=True).start()
+        
     def create_master_password(self):
         """Create master password"""
+        if self.init_button.instate(['disabled']):
+            return
+            
         password = self.master_password_input.get()
         confirm = self.confirm_password_input.get()
         
@@ -613,44 +730,79 @@ class PasswordManagerGUI:
             messagebox.showerror("SECURITY ERROR", "◢ MINIMUM 8 CHARACTER QUANTUM KEY ◣")
             return
             
-        try:
-            self.password_manager = PasswordManager()
-            self.password_manager.initialize_master_password(password)
-            self.is_authenticated = True
+        # Key derivation takes a while, so keep it off the Tk thread
+        def setup():
+            from password_manager import PasswordManager
+            password_manager = PasswordManager()
+            password_manager.initialize_master_password(password)
+            return password_manager
             
-            messagebox.showinfo("SYSTEM ONLINE", "◢ QUANTUM VAULT INITIALIZED ◣")
-            self.show_cyber_main_screen()
-        except Exception as e:
-            messagebox.showerror("SYSTEM FAILURE", f"◢ INITIALIZATION ERROR ◣\n{str(e)}")
+        self.init_button.configure(text="◢ INITIALIZING… ◣")
+        self.init_button.state(['disabled'])
+        self._run_bg(setup, self._on_setup_done)
+        
+    def _on_setup_done(self, password_manager, error):
+        """Finish create_master_password once the worker is done"""
+        self.init_button.configure(text="◢ INITIALIZE VAULT ◣")
+        self.init_button.state(['!disabled'])
+        if error is not None:
+            messagebox.showerror("SYSTEM FAILURE", f"◢ INITIALIZATION ERROR ◣\n{str(error)}")
+            return
+            
+        self.password_manager = password_manager
+        self.is_authenticated = True
+        
+        messagebox.showinfo("SYSTEM ONLINE", "◢ QUANTUM VAULT INITIALIZED ◣")
+        self.show_cyber_main_screen()
+        self.drop_screen('setup')
             
     def authenticate(self):
         """Authenticate user"""
+        if self.access_button.instate(['disabled']):
+            return
+            
         password = self.master_password_input.get()
         
         if not password:
             messagebox.showerror("ACCESS DENIED", "◢ QUANTUM KEY REQUIRED ◣")
             return
             
-        try:
-            self.password_manager = PasswordManager()
-            if self.password_manager.authenticate(password):
-                self.is_authenticated = True
-                messagebox.showinfo("ACCESS GRANTED", "◢ NEURAL LINK ESTABLISHED ◣")
-                self.show_cyber_main_screen()
-            else:
-                messagebox.showerror("ACCESS DENIED", "◢ INVALID QUANTUM KEY ◣")
-                self.master_password_input.clear()
-        except Exception as e:
-            messagebox.showerror("SYSTEM ERROR", f"◢ AUTHENTICATION FAILURE ◣\n{str(e)}")
+        # Key derivation and decrypting the vault take a while, so keep them off the Tk thread
+        def unlock():
+            from password_manager import PasswordManager
+            password_manager = PasswordManager()
+            return password_manager if password_manager.authenticate(password) else None
+            
+        self.access_button.configure(text="◢ AUTHENTICATING… ◣")
+        self.access_button.state(['disabled'])
+        self._run_bg(unlock, self._on_auth_done)
+        
+    def _on_auth_done(self, password_manager, error):
+        """Finish authenticate once the worker is done"""
+        self.access_button.configure(text="◢ ACCESS VAULT ◣")
+        self.access_button.state(['!disabled'])
+        if error is not None:
+            messagebox.showerror("SYSTEM ERROR", f"◢ AUTHENTICATION FAILURE ◣\n{str(error)}")
+        elif password_manager is None:
+            messagebox.showerror("ACCESS DENIED", "◢ INVALID QUANTUM KEY ◣")
+            self.master_password_input.clear()
+        else:
+            # The auth screen outlives the unlock, so its input must not keep the password
+            self.master_password_input.clear()
+            self.password_manager = password_manager
+            self.is_authenticated = True
+            messagebox.showinfo("ACCESS GRANTED", "◢ NEURAL LINK ESTABLISHED ◣")
+            self.show_cyber_main_screen()
             
     def show_cyber_main_screen(self):
         """Show futuristic main interface"""
-        self.clear_window()
+        self.show_screen('main', self.build_cyber_main_screen)
         
-        # Main container
-        main_frame = tk.Frame(self.root, bg="#000000")
-        main_frame.pack(fill="both", expand=True)
+        # Load data matrix
+        self.refresh_data_matrix()
         
+    def build_cyber_main_screen(self, main_frame):
+        """Build the main interface"""
         # Animated header
         header = HolographicHeader(main_frame, height=100)
         header.pack(fill="x")
@@ -729,7 +881,8 @@ class PasswordManagerGUI:
             placeholder="Search quantum data..."
         )
         self.search_input.pack()
-        self.search_input.bind('<KeyRelease>', lambda e: self.search_credentials())
+        # Fires only when the text changes (typing, paste, delete), not on arrow or modifier keys
+        self.search_input.var.trace_add('write', self.schedule_search)
         
         # Add new data
         add_btn = FuturisticButton(
@@ -744,42 +897,47 @@ class PasswordManagerGUI:
         matrix_card = CyberCard(interface_frame)
         matrix_card.pack(fill="both", expand=True, ipady=25, ipadx=30)
         
-        # Scrollable matrix
+        # Scrollable matrix; only the records in view get widgets (see _render_matrix)
         canvas = tk.Canvas(matrix_card, bg="#0F172A", highlightthickness=0)
         scrollbar = ttk.Scrollbar(matrix_card, orient="vertical", command=canvas.yview, style="Cyber.Vertical.TScrollbar")
-        self.credentials_frame = tk.Frame(canvas, bg="#0F172A")
-        
-        canvas.configure(yscrollcommand=scrollbar.set)
+        self.matrix_canvas = canvas
+        self.matrix_scrollbar = scrollbar
+        self.matrix_rows = []
+        self.row_pool = []
+        self.row_height = None
+        self.matrix_message = None
+        
+        canvas.configure(yscrollcommand=self._on_matrix_scroll)
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
+        canvas.bind('<Configure>', self._on_matrix_resize)
         
-        canvas.create_window((0, 0), window=self.credentials_frame, anchor="nw")
-        self.credentials_frame.bind(
-            '<Configure>',
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        # Load data matrix
-        self.refresh_data_matrix()
+    def clear_cyber_main_screen(self):
+        """Wipe the credentials from the (hidden) main screen on logout"""
+        if 'main' not in self.screens:
+            return
+        self.search_input.clear()
+        self.show_matrix_rows([])
+        for row in self.row_pool:
+            self._bind_matrix_row(row, "", {'username': ""})
         
     def refresh_data_matrix(self):
         """Load and display credentials in cyber style"""
         if not self.password_manager:
             return
             
-        # Clear existing
-        for widget in self.credentials_frame.winfo_children():
-            widget.destroy()
-            
         try:
             credentials = self.password_manager.get_all_credentials()
             self.current_credentials = credentials
+            # Lowercased once per load; a NUL keeps a query from matching across the two fields
+            self.search_index = [
+                (f"{service.lower()}\x00{data.get('username', '').lower()}", service, data)
+                for service, data in credentials.items()
+            ]
+            self.shown_query = ""
             
             if not credentials:
                 # Empty matrix state
-                empty_frame = tk.Frame(self.credentials_frame, bg="#0F172A")
-                empty_frame.pack(expand=True, fill="both", pady=80)
-                
                 empty_art = [
                     "╔═══════════════════════════╗",
                     "║     DATA MATRIX EMPTY     ║",
@@ -789,28 +947,97 @@ class PasswordManagerGUI:
                     "║   INITIALIZE NEW DATA     ║",
                     "╚═══════════════════════════╝"
                 ]
-                
-                for line in empty_art:
-                    empty_label = tk.Label(
-                        empty_frame,
-                        text=line,
-                        font=("Consolas", 10),
-                        bg="#0F172A",
-                        fg="#334155"
-                    )
-                    empty_label.pack()
+                self.show_matrix_rows([], ("\n".join(empty_art), ("Consolas", 10), "#334155", 80))
             else:
-                for service, data in credentials.items():
-                    self.create_cyber_data_item(service, data)
+                self.show_matrix_rows(list(credentials.items()))
                     
         except Exception as e:
             messagebox.showerror("MATRIX ERROR", f"◢ DATA LOAD FAILURE ◣\n{str(e)}")
             
-    def create_cyber_data_item(self, service, data):
-        """Create futuristic credential item"""
+    def show_matrix_rows(self, rows, message=None):
+        """Show (service, data) records in the data matrix; message is (text, font, fg, pady) for an empty list"""
+        self.matrix_rows = rows
+        
+        canvas = self.matrix_canvas
+        if self.matrix_message:
+            canvas.delete("message")
+            self.matrix_message.destroy()
+            self.matrix_message = None
+        if message:
+            text, font, fg, pady = message
+            self.matrix_message = tk.Label(canvas, text=text, font=font, bg="#0F172A", fg=fg)
+            canvas.create_window(canvas.winfo_width() // 2, pady, window=self.matrix_message, anchor="n",
+                                 tags="message")
+            
+        self._update_matrix_scrollregion()
+        self._render_matrix()
+        
+    def _update_matrix_scrollregion(self):
+        height = len(self.matrix_rows) * (self.row_height or 0)
+        self.matrix_canvas.configure(scrollregion=(0, 0, self.matrix_canvas.winfo_width(), height))
+        
+    def _on_matrix_scroll(self, first, last):
+        self.matrix_scrollbar.set(first, last)
+        self._render_matrix()
+        
+    def _on_matrix_resize(self, event):
+        for row in self.row_pool:
+            self.matrix_canvas.itemconfigure(row['item'], width=event.width)
+        if self.matrix_message:
+            self.matrix_canvas.coords("message", event.width // 2, self.matrix_canvas.coords("message")[1])
+        self._update_matrix_scrollregion()
+        self._render_matrix()
+        
+    def _render_matrix(self):
+        """Bind the pooled record widgets to the records currently in the viewport"""
+        canvas = self.matrix_canvas
+        if not self.matrix_rows:
+            first = last = 0
+        else:
+            if self.row_height is None:
+                self._new_matrix_row()  # measures the row height
+            first = int(canvas.canvasy(0)) // self.row_height
+            last = min(len(self.matrix_rows), first + canvas.winfo_height() // self.row_height + 2)
+            while len(self.row_pool) < last - first:
+                self._new_matrix_row()
+                
+        # Record i always lives in pool slot i % pool size, so scrolling by one
+        # record rebinds one slot and the others keep their widgets untouched
+        pool = self.row_pool
+        for index in range(first, last):
+            row = pool[index % len(pool)]
+            self._bind_matrix_row(row, *self.matrix_rows[index])
+            if row['index'] != index:
+                canvas.coords(row['item'], 0, index * self.row_height)
+                if row['index'] is None:
+                    canvas.itemconfigure(row['item'], state="normal")
+                row['index'] = index
+        visible = {index % len(pool) for index in range(first, last)}
+        for slot, row in enumerate(pool):
+            if slot not in visible and row['index'] is not None:
+                canvas.itemconfigure(row['item'], state="hidden")
+                row['index'] = None
+                
+    def _bind_matrix_row(self, row, service, data):
+        """Point a pooled record at a service, configuring only the labels whose text changed"""
+        username = data.get('username', 'NO_USER')
+        if row['service'] != service:
+            row['service'] = service
+            row['service_label'].configure(text=service.upper())
+        if row['username'] != username:
+            row['username'] = username
+            row['user_label'].configure(text=f"► USER_ID: {username}")
+        
+    def _new_matrix_row(self):
+        """Create one pooled record widget; the buttons act on whichever service it shows"""
+        canvas = self.matrix_canvas
+        row = {'service': None, 'username': None, 'index': None}
+        slot = tk.Frame(canvas, bg="#0F172A")
+        row['slot'] = slot
+        
         # Data record container
         record_frame = tk.Frame(
-            self.credentials_frame,
+            slot,
             bg="#1E293B",
             relief="flat",
             highlightbackground="#00D4FF",
@@ -835,7 +1062,6 @@ class PasswordManagerGUI:
         # Service name
         service_label = tk.Label(
             header_frame,
-            text=service.upper(),
             font=("Consolas", 13, "bold"),
             bg="#1E293B",
             fg="#E2E8F0"
@@ -857,10 +1083,8 @@ class PasswordManagerGUI:
         info_frame.pack(fill="x", pady=(0, 12))
         
         # Username
-        username = data.get('username', 'NO_USER')
         user_label = tk.Label(
             info_frame,
-            text=f"► USER_ID: {username}",
             font=("Consolas", 10),
             bg="#1E293B",
             fg="#94A3B8"
@@ -871,48 +1095,107 @@ class PasswordManagerGUI:
         actions_frame = tk.Frame(record_frame, bg="#1E293B")
         actions_frame.pack(fill="x")
         
-        # Action buttons
-        copy_btn = FuturisticButton(
-            actions_frame,
-            text="COPY",
-            command=lambda s=service: self.copy_password(s),
-            style="success",
-            size="small"
-        )
-        copy_btn.pack(side="right", padx=(6, 0))
-        
-        edit_btn = FuturisticButton(
-            actions_frame,
-            text="EDIT",
-            command=lambda s=service: self.edit_credential(s),
-            style="warning",
-            size="small"
-        )
-        edit_btn.pack(side="right", padx=(6, 0))
-        
-        delete_btn = FuturisticButton(
+        # One action button; COPY/EDIT/DELETE live in the shared row menu
+        actions_btn = FuturisticButton(
             actions_frame,
-            text="DELETE",
-            command=lambda s=service: self.delete_credential(s),
-            style="danger",
+            text="◢ ⋯ ◣",
+            command=lambda: self.show_row_menu(row['service']),
+            style="ghost",
             size="small"
         )
-        delete_btn.pack(side="right", padx=(6, 0))
+        actions_btn.pack(side="right", padx=(6, 0))
+        
+        row['service_label'] = service_label
+        row['user_label'] = user_label
+        row['item'] = canvas.create_window(0, 0, window=slot, anchor="nw", width=canvas.winfo_width(),
+                                           state="hidden")
+        if self.row_height is None:
+            # Every record has the same layout, so one measurement covers them all
+            slot.update_idletasks()
+            self.row_height = slot.winfo_reqheight()
+        self.row_pool.append(row)
+        return row
+        
+    def show_row_menu(self, service):
+        """Fill the shared row menu for service and pop it up at the pointer"""
+        menu = self.row_menu
+        menu.delete(0, "end")
+        menu.add_command(label="COPY", command=lambda: self.copy_password(service))
+        menu.add_command(label="EDIT", command=lambda: self.edit_credential(service))
+        menu.add_separator()
+        menu.add_command(label="DELETE", foreground="#FF073A",
+                         command=lambda: self.delete_credential(service))
+        try:
+            menu.tk_popup(*self.root.winfo_pointerxy())
+        finally:
+            menu.grab_release()
         
     def show_cyber_add_dialog(self):
         """Show futuristic add dialog"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("◢ NEW DATA ENTRY ◣")
-        dialog.geometry("550x700")
-        dialog.configure(bg="#000000")
-        dialog.transient(self.root)
-        dialog.grab_set()
-        dialog.resizable(False, False)
+        self.show_credential_dialog("◢ NEW DATA ENTRY ◣", "◢ QUANTUM DATA INITIALIZATION ◣",
+                                    "◢ COMMIT DATA ◣", self.save_cyber_credential)
+        
+    def show_cyber_edit_dialog(self, service, credential):
+        """Show futuristic edit dialog"""
+        self.show_credential_dialog("◢ EDIT DATA ENTRY ◣", "◢ QUANTUM DATA MODIFICATION ◣",
+                                    "◢ UPDATE DATA ◣", self.update_cyber_credential, service, credential)
+        
+    def show_credential_dialog(self, title, heading, save_text, on_save, service=None, credential=None):
+        """Fill and show the shared add/edit dialog; the service is read-only when editing"""
+        dialog = self.credential_dialog
+        if dialog is None or not dialog['window'].winfo_exists():
+            dialog = self.credential_dialog = self.build_credential_dialog()
+        window = dialog['window']
+        credential = credential or {}
+        
+        window.title(title)
+        dialog['heading'].configure(text=heading)
+        dialog['service'].entry.config(state='normal')
+        dialog['service'].set(service)
+        if service is not None:
+            dialog['service'].entry.config(state='disabled')
+        dialog['username'].set(credential.get('username', ''))
+        dialog['password'].set(credential.get('password', ''))
+        dialog['url'].set(credential.get('url', ''))
+        dialog['save'].configure(text=save_text, command=lambda: on_save(
+            dialog['service'].get(),
+            dialog['username'].get(),
+            dialog['password'].get(),
+            dialog['url'].get()
+        ))
         
         # Center dialog
         x = self.root.winfo_rootx() + (self.root.winfo_width() - 550) // 2
         y = self.root.winfo_rooty() + (self.root.winfo_height() - 700) // 2
-        dialog.geometry(f"550x700+{x}+{y}")
+        window.geometry(f"550x700+{x}+{y}")
+        
+        # Show the finished dialog; a grab needs it to be viewable
+        window.update_idletasks()
+        window.deiconify()
+        window.wait_visibility()
+        window.grab_set()
+        
+        # Focus
+        (dialog['service'] if service is None else dialog['username']).focus()
+        
+    def close_credential_dialog(self):
+        """Hide the add/edit dialog for reuse, clearing what was typed into it"""
+        dialog = self.credential_dialog
+        dialog['window'].grab_release()
+        for name in ('service', 'username', 'password', 'url'):
+            dialog[name].entry.config(state='normal')
+            dialog[name].clear()
+        dialog['window'].withdraw()
+        
+    def build_credential_dialog(self):
+        """Build the add/edit dialog once; it is hidden, not destroyed, between uses"""
+        dialog = tk.Toplevel(self.root)
+        # Build while withdrawn so the whole form is laid out once, not after every pack()
+        dialog.withdraw()
+        dialog.configure(bg="#000000")
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+        dialog.protocol("WM_DELETE_WINDOW", self.close_credential_dialog)
         
         # Header
         header_frame = tk.Frame(dialog, bg="#0F172A", height=100)
@@ -925,8 +1208,7 @@ class PasswordManagerGUI:
         
         header_title = tk.Label(
             header_frame,
-            text="◢ QUANTUM DATA INITIALIZATION ◣",
-            font=("Consolas", 14, "bold"),
+            font=_font("dialog_header"),
             bg="#0F172A",
             fg="#00D4FF"
         )
@@ -939,14 +1221,16 @@ class PasswordManagerGUI:
         # Form
         form_frame = tk.Frame(form_container, bg="#0F172A")
         form_frame.pack(fill="both", expand=True, padx=35, pady=35)
+        # The form rows are one column, so grid places each row once
+        form_frame.grid_columnconfigure(0, weight=1)
         
-        # Service
+        # Service (read-only when editing)
         service_input = CyberInput(
             form_frame,
             label="TARGET SYSTEM",
             placeholder="e.g., NEURAL_NET_GMAIL, QUANTUM_GITHUB"
         )
-        service_input.pack(fill="x", pady=(0, 25))
+        service_input.grid(row=0, column=0, sticky="ew", pady=(0, 25))
         
         # Username
         username_input = CyberInput(
@@ -954,11 +1238,11 @@ class PasswordManagerGUI:
             label="USER IDENTIFIER",
             placeholder="neural.user@quantum.net"
         )
-        username_input.pack(fill="x", pady=(0, 25))
+        username_input.grid(row=1, column=0, sticky="ew", pady=(0, 25))
         
         # Password section
         password_section = tk.Frame(form_frame, bg="#0F172A")
-        password_section.pack(fill="x", pady=(0, 25))
+        password_section.grid(row=2, column=0, sticky="ew", pady=(0, 25))
         
         password_input = CyberInput(
             password_section,
@@ -983,11 +1267,11 @@ class PasswordManagerGUI:
             label="NETWORK ADDRESS",
             placeholder="https://quantum.target.system"
         )
-        url_input.pack(fill="x", pady=(0, 35))
+        url_input.grid(row=3, column=0, sticky="ew", pady=(0, 35))
         
         # Control panel
         control_frame = tk.Frame(form_frame, bg="#0F172A")
-        control_frame.pack(fill="x")
+        control_frame.grid(row=4, column=0, sticky="ew")
         
         # Cyber decoration
         control_decoration = tk.Frame(control_frame, bg="#00D4FF", height=2)
@@ -1000,7 +1284,7 @@ class PasswordManagerGUI:
         cancel_btn = FuturisticButton(
             button_frame,
             text="◢ ABORT ◣",
-            command=dialog.destroy,
+            command=self.close_credential_dialog,
             style="danger"
         )
         cancel_btn.pack(side="right", padx=(15, 0))
@@ -1008,206 +1292,80 @@ class PasswordManagerGUI:
         save_btn = FuturisticButton(
             button_frame,
             text="◢ COMMIT DATA ◣",
-            command=lambda: self.save_cyber_credential(
-                service_input.get(),
-                username_input.get(),
-                password_input.get(),
-                url_input.get(),
-                dialog
-            ),
             style="neon"
         )
         save_btn.pack(side="right")
         
-        # Focus
-        service_input.focus()
+        return {'window': dialog, 'heading': header_title, 'service': service_input,
+                'username': username_input, 'password': password_input, 'url': url_input,
+                'save': save_btn}
         
     def generate_quantum_password(self, password_input):
         """Generate futuristic password"""
-        # Cyber-style password generation
-        chars = string.ascii_letters + string.digits + "!@#$%^&*()_+-=[]{}|;:,.<>?"
-        password = ''.join(random.choice(chars) for _ in range(18))
-        password_input.set(password)
-        messagebox.showinfo("QUANTUM GEN", "◢ ENCRYPTION KEY GENERATED ◣")
+        # Same CSPRNG generator as the other interfaces
+        from crypto_utils import CryptoUtils
+        password_input.set(CryptoUtils.generate_secure_password(18))
         
-    def save_cyber_credential(self, service, username, password, url, dialog):
+    def save_cyber_credential(self, service, username, password, url):
         """Save new credential"""
         if not all([service, username, password]):
             messagebox.showerror("DATA ERROR", "◢ MISSING REQUIRED FIELDS ◣")
             return
             
         try:
-            notes = f"URL: {url}" if url else ""
-            self.password_manager.add_credential(service, username, password, notes)
-            dialog.destroy()
+            self.password_manager.add_credential(service, username, password, url=url)
+            self.close_credential_dialog()
             self.refresh_data_matrix()
-            messagebox.showinfo("DATA COMMIT", "◢ QUANTUM RECORD CREATED ◣")
+            self.flash_status("◢ QUANTUM RECORD CREATED ◣")
         except Exception as e:
             messagebox.showerror("COMMIT ERROR", f"◢ DATA SAVE FAILURE ◣\n{str(e)}")
             
     def copy_password(self, service):
         """Copy password to clipboard"""
         try:
-            credentials = self.password_manager.get_all_credentials()
-            password = credentials[service]['password']
+            password = self.current_credentials[service]['password']
             self.root.clipboard_clear()
             self.root.clipboard_append(password)
-            messagebox.showinfo("DATA TRANSFER", f"◢ {service} KEY COPIED ◣")
+            
+            # Wipe the key later, unless something else has been copied since
+            if self.clip_after_id:
+                self.root.after_cancel(self.clip_after_id)
+            self.clip_after_id = self.root.after(CLIPBOARD_CLEAR_MS, self.clear_clipboard, password)
+            self.flash_status(f"◢ {service} KEY COPIED ◣ (WIPED IN {CLIPBOARD_CLEAR_MS // 1000}s)")
         except Exception as e:
             messagebox.showerror("TRANSFER ERROR", f"◢ COPY FAILURE ◣\n{str(e)}")
             
+    def clear_clipboard(self, password=None):
+        """Clear a copied key from the clipboard; with password, only if it is still there"""
+        self.clip_after_id = None
+        if password is not None:
+            try:
+                if self.root.clipboard_get() != password:
+                    return
+            except tk.TclError:
+                return  # Clipboard is empty or holds something that is not text
+        self.root.clipboard_clear()
+        self.root.clipboard_append('')
+            
     def edit_credential(self, service):
         """Show futuristic edit dialog"""
-        credential = self.password_manager.get_credential(service)
+        credential = self.current_credentials.get(service)
         if not credential:
             messagebox.showerror("SYSTEM ERROR", "◢ UNABLE TO LOAD DATA ◣")
             return
         self.show_cyber_edit_dialog(service, credential)
 
-    def show_cyber_edit_dialog(self, service, credential):
-        """Show futuristic edit dialog"""
-        dialog = tk.Toplevel(self.root)
-        dialog.title("◢ EDIT DATA ENTRY ◣")
-        dialog.geometry("550x700")
-        dialog.configure(bg="#000000")
-        dialog.transient(self.root)
-        dialog.grab_set()
-        dialog.resizable(False, False)
-
-        # Center dialog
-        x = self.root.winfo_rootx() + (self.root.winfo_width() - 550) // 2
-        y = self.root.winfo_rooty() + (self.root.winfo_height() - 700) // 2
-        dialog.geometry(f"550x700+{x}+{y}")
-
-        # Header
-        header_frame = tk.Frame(dialog, bg="#0F172A", height=100)
-        header_frame.pack(fill="x")
-        header_frame.pack_propagate(False)
-
-        # Header decoration
-        decoration_line = tk.Frame(header_frame, bg="#00FF41", height=3)
-        decoration_line.pack(fill="x")
-
-        header_title = tk.Label(
-            header_frame,
-            text="◢ QUANTUM DATA MODIFICATION ◣",
-            font=("Consolas", 14, "bold"),
-            bg="#0F172A",
-            fg="#00D4FF"
-        )
-        header_title.pack(expand=True)
-
-        # Form container
-        form_container = CyberCard(dialog)
-        form_container.pack(fill="both", expand=True, padx=25, pady=25)
-
-        # Form
-        form_frame = tk.Frame(form_container, bg="#0F172A")
-        form_frame.pack(fill="both", expand=True, padx=35, pady=35)
-
-        # Service (read-only)
-        service_input = CyberInput(
-            form_frame,
-            label="TARGET SYSTEM",
-            placeholder="e.g., NEURAL_NET_GMAIL, QUANTUM_GITHUB"
-        )
-        service_input.pack(fill="x", pady=(0, 25))
-        service_input.set(service)
-        service_input.entry.config(state='disabled')
-
-
-        # Username
-        username_input = CyberInput(
-            form_frame,
-            label="USER IDENTIFIER",
-            placeholder="neural.user@quantum.net"
-        )
-        username_input.pack(fill="x", pady=(0, 25))
-        username_input.set(credential.get('username', ''))
-
-        # Password section
-        password_section = tk.Frame(form_frame, bg="#0F172A")
-        password_section.pack(fill="x", pady=(0, 25))
-
-        password_input = CyberInput(
-            password_section,
-            label="ACCESS KEY",
-            placeholder="quantum_encryption_key",
-            is_password=True
-        )
-        password_input.pack(side="left", fill="x", expand=True, padx=(0, 15))
-        password_input.set(credential.get('password', ''))
-
-        generate_btn = FuturisticButton(
-            password_section,
-            text="◢ GEN ◣",
-            command=lambda: self.generate_quantum_password(password_input),
-            style="neon",
-            size="small"
-        )
-        generate_btn.pack(side="right", anchor="s", pady=(28, 0))
-
-        # URL
-        url_input = CyberInput(
-            form_frame,
-            label="NETWORK ADDRESS",
-            placeholder="https://quantum.target.system"
-        )
-        url_input.pack(fill="x", pady=(0, 35))
-        notes = credential.get('notes', '')
-        url = notes.replace("URL: ", "") if notes.startswith("URL: ") else ""
-        url_input.set(url)
-
-
-        # Control panel
-        control_frame = tk.Frame(form_frame, bg="#0F172A")
-        control_frame.pack(fill="x")
-
-        # Cyber decoration
-        control_decoration = tk.Frame(control_frame, bg="#00D4FF", height=2)
-        control_decoration.pack(fill="x", pady=(0, 20))
-
-        # Buttons
-        button_frame = tk.Frame(control_frame, bg="#0F172A")
-        button_frame.pack(fill="x")
-
-        cancel_btn = FuturisticButton(
-            button_frame,
-            text="◢ ABORT ◣",
-            command=dialog.destroy,
-            style="danger"
-        )
-        cancel_btn.pack(side="right", padx=(15, 0))
-
-        save_btn = FuturisticButton(
-            button_frame,
-            text="◢ UPDATE DATA ◣",
-            command=lambda: self.update_cyber_credential(
-                service,
-                username_input.get(),
-                password_input.get(),
-                url_input.get(),
-                dialog
-            ),
-            style="neon"
-        )
-        save_btn.pack(side="right")
-
-        # Focus
-        username_input.focus()
-
-    def update_cyber_credential(self, service, username, password, url, dialog):
+    def update_cyber_credential(self, service, username, password, url):
         """Update credential"""
         if not all([service, username, password]):
             messagebox.showerror("DATA ERROR", "◢ MISSING REQUIRED FIELDS ◣")
             return
 
         try:
-            notes = f"URL: {url}" if url else ""
-            self.password_manager.update_credential(service, username, password, notes)
-            dialog.destroy()
+            self.password_manager.update_credential(service, username, password, url=url)
+            self.close_credential_dialog()
             self.refresh_data_matrix()
-            messagebox.showinfo("DATA UPDATE", "◢ QUANTUM RECORD UPDATED ◣")
+            self.flash_status("◢ QUANTUM RECORD UPDATED ◣")
         except Exception as e:
             messagebox.showerror("UPDATE ERROR", f"◢ DATA UPDATE FAILURE ◣\n{str(e)}")
 
@@ -1217,51 +1375,71 @@ class PasswordManagerGUI:
             try:
                 self.password_manager.delete_credential(service)
                 self.refresh_data_matrix()
-                messagebox.showinfo("DATA PURGED", f"◢ {service} DELETED ◣")
+                self.flash_status(f"◢ {service} DELETED ◣")
             except Exception as e:
                 messagebox.showerror("PURGE ERROR", f"◢ DELETE FAILURE ◣\n{str(e)}")
                 
+    def flash_status(self, message, ok=True):
+        """Show a message in the status bar for STATUS_CLEAR_MS without blocking like a messagebox"""
+        self.status_label.configure(text=message, fg="#00FF41" if ok else "#FF073A")
+        if self.status_after_id:
+            self.root.after_cancel(self.status_after_id)
+        self.status_after_id = self.root.after(STATUS_CLEAR_MS, self.clear_status)
+        
+    def clear_status(self):
+        self.status_after_id = None
+        self.status_label.configure(text="")
+                
+    def schedule_search(self, *args):
+        """Run the search 150 ms after the last keystroke, so a burst of typing filters once"""
+        self.cancel_search()
+        self.search_after_id = self.root.after(150, self.search_credentials)
+        
+    def cancel_search(self):
+        if self.search_after_id:
+            self.root.after_cancel(self.search_after_id)
+            self.search_after_id = None
+            
     def search_credentials(self):
         """Search credentials with cyber styling"""
+        self.search_after_id = None
         query = self.search_input.get().lower()
+        # The placeholder coming and going on focus changes rewrites the text without changing the query
+        if query == self.shown_query:
+            return
+        self.shown_query = query
+        self.matrix_canvas.yview_moveto(0)
         
-        # Clear existing
-        for widget in self.credentials_frame.winfo_children():
-            widget.destroy()
-            
         if not query:
             # Show all
-            for service, data in self.current_credentials.items():
-                self.create_cyber_data_item(service, data)
+            self.show_matrix_rows(list(self.current_credentials.items()))
         else:
             # Filter
-            filtered = {
-                k: v for k, v in self.current_credentials.items()
-                if query in k.lower() or query in v.get('username', '').lower()
-            }
+            filtered = [(service, data) for text, service, data in self.search_index if query in text]
             
             if filtered:
-                for service, data in filtered.items():
-                    self.create_cyber_data_item(service, data)
+                self.show_matrix_rows(filtered)
             else:
                 # No results
-                no_results_frame = tk.Frame(self.credentials_frame, bg="#0F172A")
-                no_results_frame.pack(pady=60)
-                
-                no_results = tk.Label(
-                    no_results_frame,
-                    text="◢ NO QUANTUM MATCHES FOUND ◣",
-                    font=("Consolas", 12, "bold"),
-                    bg="#0F172A",
-                    fg="#64748B"
-                )
-                no_results.pack()
+                self.show_matrix_rows([], ("◢ NO QUANTUM MATCHES FOUND ◣", ("Consolas", 12, "bold"), "#64748B", 60))
                 
     def logout(self):
         """Logout with cyber style"""
+        from crypto_utils import CryptoUtils
+        CryptoUtils.clear_key_cache()
+        if self.clip_after_id:
+            self.root.after_cancel(self.clip_after_id)
+            self.clear_clipboard()
+        if self.status_after_id:
+            self.root.after_cancel(self.status_after_id)
+            self.clear_status()
         self.is_authenticated = False
         self.password_manager = None
         self.current_credentials = {}
+        self.search_index = []
+        self.shown_query = None
+        self.clear_cyber_main_screen()
+        self.cancel_search()
         messagebox.showinfo("NEURAL DISCONNECT", "◢ QUANTUM LINK TERMINATED ◣")
         self.show_cyber_auth_screen()
         
@@ -5,29 +5,82 @@ A command-line password manager with AES encryption and secure local storage.
 """
 
 import sys
+import contextlib
 import getpass
 import os
+import time
 from password_manager import PasswordManager
 from crypto_utils import CryptoUtils
 
+try:
+    import readline  # Line editing and history for input(); absent on stock Windows
+except ImportError:
+    readline = None
+
+# readline key bindings for Tab: (completing, literal insert), per readline flavour
+if readline is not None and "libedit" in (readline.__doc__ or ""):
+    TAB_BINDINGS = ("bind ^I rl_complete", "bind ^I ed-insert")  # macOS ships libedit
+else:
+    TAB_BINDINGS = ("tab: complete", "tab: tab-insert")
+
+SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+PASSWORD_MASK = "*" * 8
+
+MENU = "\n".join([
+    "",
+    "="*50,
+    "🔐 SECURE PASSWORD MANAGER",
+    "="*50,
+    "1. Add New Credential",
+    "2. View All Credentials",
+    "3. Search Credential",
+    "4. Update Credential",
+    "5. Delete Credential",
+    "6. Change Master Password",
+    "7. Export Credentials (Encrypted)",
+    "8. Exit",
+    "="*50,
+    "",
+])
+
 def clear_screen():
     """Clear the terminal screen for better UX"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # ANSI clear + cursor home; no subprocess per redraw
+    sys.stdout.write("\x1b[2J\x1b[H")
+    sys.stdout.flush()
+
+@contextlib.contextmanager
+def site_completion(pm):
+    """Tab-complete stored site names at input() prompts inside the block, where readline is available"""
+    if readline is None:
+        yield
+        return
+    
+    matches = []
+    
+    def complete(text, state):
+        if state == 0:
+            prefix = text.lower()
+            matches[:] = sorted(site for site in pm.get_all_credentials() if site.lower().startswith(prefix))
+        return matches[state] if state < len(matches) else None
+    
+    delims = readline.get_completer_delims()
+    readline.set_completer(complete)
+    # Site names may contain spaces and punctuation; complete the whole line
+    readline.set_completer_delims("")
+    readline.parse_and_bind(TAB_BINDINGS[0])
+    try:
+        yield
+    finally:
+        # Every other prompt gets a literal Tab again, as Python sets up readline
+        readline.parse_and_bind(TAB_BINDINGS[1])
+        readline.set_completer_delims(delims)
+        readline.set_completer(None)
 
 def display_menu():
     """Display the main menu options"""
-    print("\n" + "="*50)
-    print("🔐 SECURE PASSWORD MANAGER")
-    print("="*50)
-    print("1. Add New Credential")
-    print("2. View All Credentials")
-    print("3. Search Credential")
-    print("4. Update Credential")
-    print("5. Delete Credential")
-    print("6. Change Master Password")
-    print("7. Export Credentials (Encrypted)")
-    print("8. Exit")
-    print("="*50)
+    # Built once at import; one write per redraw
+    sys.stdout.write(MENU)
 
 def get_master_password(prompt="Enter master password: "):
     """Securely get master password from user"""
@@ -49,10 +102,15 @@ def validate_password_strength(password):
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
     
-    has_upper = any(c.isupper() for c in password)
-    has_lower = any(c.islower() for c in password)
-    has_digit = any(c.isdigit() for c in password)
-    has_special = any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password)
+    # Single pass over the password, stopping once every class is seen
+    has_upper = has_lower = has_digit = has_special = False
+    for c in password:
+        has_upper |= c.isupper()
+        has_lower |= c.islower()
+        has_digit |= c.isdigit()
+        has_special |= c in SPECIAL_CHARS
+        if has_upper and has_lower and has_digit and has_special:
+            break
     
     missing = []
     if not has_upper:
@@ -71,8 +129,7 @@ def validate_password_strength(password):
 
 def add_credential(pm):
     """Add a new credential with validation"""
-    print("\n📝 Add New Credential")
-    print("-" * 30)
+    print("\n📝 Add New Credential\n" + "-" * 30)
     
     site = input("Site/Service name: ").strip()
     if not site:
@@ -111,24 +168,33 @@ def add_credential(pm):
 
 def view_all_credentials(pm):
     """Display all stored credentials"""
-    print("\n📋 All Stored Credentials")
-    print("-" * 40)
+    print("\n📋 All Stored Credentials\n" + "-" * 40)
     
     try:
-        credentials = pm.get_all_credentials()
+        # List from metadata; passwords are only read if the user asks to reveal them
+        credentials = pm.list_credentials_meta()
         if not credentials:
             print("📭 No credentials stored yet.")
             return
         
+        # Build each entry as one string so it goes out in a single write
         for i, (site, data) in enumerate(credentials.items(), 1):
-            print(f"\n{i}. 🌐 {site}")
-            print(f"   👤 Username: {data['username']}")
-            print(f"   🔑 Password: {'*' * len(data['password'])}")
-            if data.get('notes'):
-                print(f"   📝 Notes: {data['notes']}")
-            print(f"   📅 Created: {data.get('created_at', 'Unknown')}")
-            if data.get('updated_at'):
-                print(f"   🔄 Updated: {data['updated_at']}")
+            url = data.get('url')
+            notes = data.get('notes')
+            updated = data.get('updated_at')
+            lines = [
+                f"\n{i}. 🌐 {site}",
+                f"   👤 Username: {data['username']}",
+                f"   🔑 Password: {PASSWORD_MASK}",
+            ]
+            if url:
+                lines.append(f"   🔗 URL: {url}")
+            if notes:
+                lines.append(f"   📝 Notes: {notes}")
+            lines.append(f"   📅 Created: {data.get('created_at', 'Unknown')}")
+            if updated:
+                lines.append(f"   🔄 Updated: {updated}")
+            print("\n".join(lines))
         
         # Option to reveal passwords
         reveal = input(f"\nReveal passwords? (y/N): ").lower()
@@ -136,7 +202,7 @@ def view_all_credentials(pm):
             print("\n" + "="*40)
             print("🔓 REVEALED PASSWORDS")
             print("="*40)
-            for site, data in credentials.items():
+            for site, data in pm.get_all_credentials().items():
                 print(f"🌐 {site}: {data['password']}")
     
     except Exception as e:
@@ -144,10 +210,10 @@ def view_all_credentials(pm):
 
 def search_credential(pm):
     """Search for a specific credential"""
-    print("\n🔍 Search Credential")
-    print("-" * 25)
+    print("\n🔍 Search Credential\n" + "-" * 25)
     
-    site = input("Enter site/service name: ").strip()
+    with site_completion(pm):
+        site = input("Enter site/service name: ").strip()
     if not site:
         print("❌ Site name cannot be empty!")
         return
@@ -162,8 +228,10 @@ def search_credential(pm):
             if reveal == 'y':
                 print(f"🔑 Password: {credential['password']}")
             else:
-                print(f"🔑 Password: {'*' * len(credential['password'])}")
+                print(f"🔑 Password: {PASSWORD_MASK}")
             
+            if credential.get('url'):
+                print(f"🔗 URL: {credential['url']}")
             if credential.get('notes'):
                 print(f"📝 Notes: {credential['notes']}")
             print(f"📅 Created: {credential.get('created_at', 'Unknown')}")
@@ -177,10 +245,10 @@ def search_credential(pm):
 
 def update_credential(pm):
     """Update an existing credential"""
-    print("\n✏️  Update Credential")
-    print("-" * 25)
+    print("\n✏️  Update Credential\n" + "-" * 25)
     
-    site = input("Enter site/service name to update: ").strip()
+    with site_completion(pm):
+        site = input("Enter site/service name to update: ").strip()
     if not site:
         print("❌ Site name cannot be empty!")
         return
@@ -193,7 +261,7 @@ def update_credential(pm):
         
         print(f"\n📋 Current credential for: {site}")
         print(f"👤 Username: {existing['username']}")
-        print(f"🔑 Password: {'*' * len(existing['password'])}")
+        print(f"🔑 Password: {PASSWORD_MASK}")
         if existing.get('notes'):
             print(f"📝 Notes: {existing['notes']}")
         
@@ -231,10 +299,10 @@ def update_credential(pm):
 
 def delete_credential(pm):
     """Delete a credential with confirmation"""
-    print("\n🗑️  Delete Credential")
-    print("-" * 25)
+    print("\n🗑️  Delete Credential\n" + "-" * 25)
     
-    site = input("Enter site/service name to delete: ").strip()
+    with site_completion(pm):
+        site = input("Enter site/service name to delete: ").strip()
     if not site:
         print("❌ Site name cannot be empty!")
         return
@@ -265,8 +333,7 @@ def delete_credential(pm):
 
 def change_master_password(pm):
     """Change the master password"""
-    print("\n🔐 Change Master Password")
-    print("-" * 30)
+    print("\n🔐 Change Master Password\n" + "-" * 30)
     
     current_password = get_master_password("Enter current master password: ")
     if not current_password:
@@ -306,8 +373,7 @@ def change_master_password(pm):
 
 def export_credentials(pm):
     """Export credentials to an encrypted backup file"""
-    print("\n💾 Export Credentials")
-    print("-" * 25)
+    print("\n💾 Export Credentials\n" + "-" * 25)
     
     filename = input("Enter backup filename (without extension): ").strip()
     if not filename:
@@ -326,6 +392,8 @@ def export_credentials(pm):
 
 def main():
     """Main application loop"""
+    if os.name == 'nt':
+        os.system('')  # Once per session: turns on ANSI escape handling in the Windows console
     clear_screen()
     print("🔐 Welcome to Secure Password Manager!")
     print("=" * 50)
@@ -381,6 +449,8 @@ def main():
                 remaining = max_attempts - attempts
                 if remaining > 0:
                     print(f"❌ Invalid master password! {remaining} attempts remaining.")
+                    # Back off before the next guess: 1s, then 2s
+                    time.sleep(min(2.0, 0.5 * (2 ** attempts)))
                 else:
                     print("❌ Maximum attempts exceeded. Access denied!")
                     sys.exit(1)
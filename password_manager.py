@@ -5,10 +5,119 @@ Handles CRUD operations, master password management, and credential storage.
 
 import json
 import os
-import hashlib
+import hmac
+import contextlib
+import functools
+import mmap
+from collections.abc import Mapping
 from datetime import datetime
+from types import MappingProxyType
 from crypto_utils import CryptoUtils
 
+try:
+    # orjson's C encoder writes compact UTF-8 bytes directly
+    import orjson
+except ImportError:
+    orjson = None
+
+# Older GUI versions stored the URL as the first notes line with this prefix
+_URL_PREFIX = "URL: "
+
+# .master_hash layouts:
+#   v3$<prf>$<iterations>$<salt hex>$<hash hex>   random salt per vault
+#   v2$<hash hex>                                  SHA-512, fixed salt
+#   <hash hex>                                     SHA-256, fixed salt
+_MASTER_HASH_PREFIX = "v3$"
+_SHA512_HASH_PREFIX = "v2$"
+_LEGACY_MASTER_SALT = b"secure_password_manager_salt_2024"
+_MASTER_HASH_ITERATIONS = 100000
+_MASTER_SALT_SIZE = 16
+
+
+def _dumps(obj):
+    """Serialize obj to compact UTF-8 JSON bytes (orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(data):
+    """Parse JSON bytes; both parsers raise json.JSONDecodeError subclasses on bad input"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _wrap_errors(message):
+    """Re-raise any exception from the decorated method as Exception(f"{message}: {e}")"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            except Exception as e:
+                raise Exception(f"{message}: {e}")
+        return wrapper
+    return decorator
+
+
+@contextlib.contextmanager
+def _open_atomic(path):
+    """Open a private (0600) temporary file for writing; on success fsync it and rename it over path.
+
+    A crash leaves either the old or the new file, never a torn one.
+    """
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    try:
+        # A large buffer turns the chunked ciphertext writes into a few syscalls
+        with os.fdopen(os.open(tmp_path, flags, 0o600), 'wb', buffering=1 << 20) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+class _PasswordlessCredential(Mapping):
+    """Read-only view of one credential with its password field hidden"""
+    __slots__ = ('_credential',)
+    
+    def __init__(self, credential):
+        self._credential = credential
+    
+    def __getitem__(self, field):
+        if field == 'password':
+            raise KeyError(field)
+        return self._credential[field]
+    
+    def __iter__(self):
+        return (field for field in self._credential if field != 'password')
+    
+    def __len__(self):
+        return len(self._credential) - ('password' in self._credential)
+
+
+class _CredentialsMeta(Mapping):
+    """Read-only site -> credential view that hides passwords without copying anything"""
+    __slots__ = ('_credentials',)
+    
+    def __init__(self, credentials):
+        self._credentials = credentials
+    
+    def __getitem__(self, site):
+        return _PasswordlessCredential(self._credentials[site])
+    
+    def __iter__(self):
+        return iter(self._credentials)
+    
+    def __len__(self):
+        return len(self._credentials)
+
+
 class PasswordManager:
     def __init__(self, data_file="credentials.json.encrypted"):
         """Initialize the password manager with encrypted storage file"""
@@ -17,48 +126,83 @@ class PasswordManager:
         self.crypto = CryptoUtils()
         self.master_password = None
         self.credentials = {}
+        self._credentials_view = MappingProxyType(self.credentials)
+        # Case-folded site name -> the key it is stored under, so lookups ignore case
+        self._site_keys = {}
+        # Case-folded names shared by several stored sites; these only match exactly
+        self._ambiguous_sites = set()
+        # get_statistics() result, dropped whenever the credentials change
+        self._statistics = None
+        # (salt, key) derived once per master password and reused by every save
+        self._session_key = None
+        # Saves requested inside batch() are deferred to one write when it exits
+        self._batch_depth = 0
+        self._dirty = False
         
         # Set secure file permissions
         self._ensure_secure_permissions()
     
     def _ensure_secure_permissions(self):
         """Ensure secure file permissions for sensitive files"""
-        try:
-            # Set restrictive permissions (owner read/write only)
-            for file_path in [self.data_file, self.master_hash_file]:
-                if os.path.exists(file_path):
-                    os.chmod(file_path, 0o600)  # rw-------
-        except OSError:
-            pass  # Ignore permission errors on systems that don't support it
-    
-    def _hash_master_password(self, password):
-        """Create a secure hash of the master password"""
-        # Use PBKDF2 with SHA-256 for secure password hashing
-        salt = b"secure_password_manager_salt_2024"  # In production, use random salt per user
-        return hashlib.pbkdf2_hmac('sha256', password.encode(), salt, 100000).hex()
+        # Set restrictive permissions (owner read/write only); files we write are created 0600
+        for file_path in [self.data_file, self.master_hash_file]:
+            try:
+                os.chmod(file_path, 0o600)  # rw-------
+            except OSError:
+                pass  # Not created yet, or a system that doesn't support it
+    
+    def _hash_master_password(self, password, salt, iterations, prf):
+        """Create a secure hash of the master password, as hex"""
+        # Use PBKDF2 for secure password hashing (fastpbkdf2 when installed)
+        pwdhash, _ = self.crypto.hash_password_raw(password, salt, prf, 32, iterations)
+        return pwdhash.hex()
+    
+    def _encode_master_hash(self, password):
+        """Hash password under a fresh random salt, in its .master_hash file form"""
+        # SHA-512 runs on 64-bit words, so CryptoUtils picks it on 64-bit hosts
+        prf = self.crypto.prf
+        salt = os.urandom(_MASTER_SALT_SIZE)
+        pwdhash = self._hash_master_password(password, salt, _MASTER_HASH_ITERATIONS, prf)
+        return f"{_MASTER_HASH_PREFIX}{prf}${_MASTER_HASH_ITERATIONS}${salt.hex()}${pwdhash}"
+    
+    @staticmethod
+    def _parse_master_hash(stored_hash):
+        """Split a stored master hash into (prf, iterations, salt, hash hex), for any layout"""
+        if stored_hash.startswith(_MASTER_HASH_PREFIX):
+            prf, iterations, salt, pwdhash = stored_hash[len(_MASTER_HASH_PREFIX):].split('$')
+            return prf, CryptoUtils.check_iterations(int(iterations)), bytes.fromhex(salt), pwdhash
+        if stored_hash.startswith(_SHA512_HASH_PREFIX):
+            return ('sha512', _MASTER_HASH_ITERATIONS, _LEGACY_MASTER_SALT,
+                    stored_hash[len(_SHA512_HASH_PREFIX):])
+        return 'sha256', _MASTER_HASH_ITERATIONS, _LEGACY_MASTER_SALT, stored_hash
+    
+    def _read_master_hash(self):
+        """Return the stored master password hash"""
+        with open(self.master_hash_file, 'r') as f:
+            return f.read().strip()
+    
+    def _write_master_hash(self, password):
+        """Store the hash of password as the master password hash"""
+        master_hash = self._encode_master_hash(password)
+        with _open_atomic(self.master_hash_file) as f:
+            f.write(master_hash.encode('ascii'))
     
     def is_first_run(self):
         """Check if this is the first time running the application"""
         return not os.path.exists(self.master_hash_file)
     
+    @_wrap_errors("Failed to initialize master password")
     def initialize_master_password(self, password):
         """Initialize the master password for first-time setup"""
-        try:
-            master_hash = self._hash_master_password(password)
-            with open(self.master_hash_file, 'w') as f:
-                f.write(master_hash)
-            
-            # Set secure permissions
-            os.chmod(self.master_hash_file, 0o600)
-            
-            # Initialize empty credentials file
-            self.master_password = password
-            self.credentials = {}
-            self._save_credentials()
-            
-            return True
-        except Exception as e:
-            raise Exception(f"Failed to initialize master password: {e}")
+        self._write_master_hash(password)
+        
+        # Initialize empty credentials file
+        self.master_password = password
+        self._session_key = None
+        self._set_credentials({})
+        self._save_credentials()
+        
+        return True
     
     def verify_master_password(self, password):
         """Verify the master password against stored hash"""
@@ -66,39 +210,58 @@ class PasswordManager:
             if not os.path.exists(self.master_hash_file):
                 return False
             
-            with open(self.master_hash_file, 'r') as f:
-                stored_hash = f.read().strip()
+            # The unlocked session's password was checked already; skip the PBKDF2 rerun
+            if self._is_session_password(password):
+                return True
             
-            provided_hash = self._hash_master_password(password)
-            return stored_hash == provided_hash
+            prf, iterations, salt, stored_hash = self._parse_master_hash(self._read_master_hash())
+            provided_hash = self._hash_master_password(password, salt, iterations, prf)
+            return hmac.compare_digest(stored_hash, provided_hash)
         except Exception:
             return False
     
+    def _is_session_password(self, password):
+        """Check (in constant time) whether password is the unlocked session's master password"""
+        return self.master_password is not None and hmac.compare_digest(
+            password.encode('utf-8'), self.master_password.encode('utf-8'))
+    
     def authenticate(self, password):
         """Authenticate user and load credentials"""
         if not self.verify_master_password(password):
             return False
         
+        # Rehash a fixed-salt master hash under its own salt while the password is at hand
+        if not self._read_master_hash().startswith(_MASTER_HASH_PREFIX):
+            self._write_master_hash(password)
+        
         self.master_password = password
+        self._session_key = None
         return self._load_credentials()
     
     def _load_credentials(self):
         """Load and decrypt credentials from file"""
         try:
-            if not os.path.exists(self.data_file):
-                self.credentials = {}
+            try:
+                f = open(self.data_file, 'rb')
+            except FileNotFoundError:
+                self._set_credentials({})
                 return True
             
-            with open(self.data_file, 'rb') as f:
-                encrypted_data = f.read()
-            
-            if not encrypted_data:
-                self.credentials = {}
-                return True
+            with f:
+                if not os.fstat(f.fileno()).st_size:
+                    self._set_credentials({})
+                    return True
+                # Decrypt straight from the page cache instead of copying the file into bytes
+                encrypted_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
             
             # Decrypt the data using master password
             decrypted_data = self.crypto.decrypt_data(encrypted_data, self.master_password)
-            self.credentials = json.loads(decrypted_data)
+            # On failure the traceback still holds views into the map, so it is left
+            # to be unmapped once they are gone; on success nothing refers to it
+            encrypted_data.close()
+            self._set_credentials(_loads(decrypted_data))
+            if self._migrate_url_notes():
+                self._save_credentials()
             return True
         
         except json.JSONDecodeError:
@@ -106,89 +269,113 @@ class PasswordManager:
         except Exception as e:
             raise Exception(f"Failed to load credentials: {e}")
     
+    @staticmethod
+    def _canon(site):
+        """Canonical form of a site name for lookups"""
+        return site.strip().casefold()
+    
+    def _set_credentials(self, credentials):
+        """Replace the credential dict and rebuild the site index"""
+        self.credentials = credentials
+        self._credentials_view = MappingProxyType(credentials)
+        self._rebuild_site_index()
+        self._statistics = None
+    
+    def _rebuild_site_index(self):
+        """Index every stored site under its case-folded name"""
+        self._site_keys = {}
+        self._ambiguous_sites = set()
+        for site in self.credentials:
+            self._index_site(site)
+    
+    def _index_site(self, site):
+        """Add site to the case-folded index, marking names that several sites fold to"""
+        canon = self._canon(site)
+        if canon in self._ambiguous_sites:
+            return
+        existing = self._site_keys.get(canon)
+        if existing is not None and existing != site:
+            # Vaults from before the index can hold e.g. both 'github' and 'GitHub'
+            del self._site_keys[canon]
+            self._ambiguous_sites.add(canon)
+        else:
+            self._site_keys[canon] = site
+    
+    def _resolve_site(self, site):
+        """Return the key site is stored under: an exact match first, then a
+        case-insensitive one unless several stored sites share that name"""
+        if site in self.credentials:
+            return site
+        return self._site_keys.get(self._canon(site))
+    
+    def _migrate_url_notes(self):
+        """Move URLs stored as a leading _URL_PREFIX notes line into their own field"""
+        migrated = False
+        for credential in self.credentials.values():
+            notes = credential.get('notes') or ''
+            if not credential.get('url') and notes.startswith(_URL_PREFIX):
+                url_line, _, rest = notes.partition('\n')
+                credential['url'] = url_line[len(_URL_PREFIX):]
+                credential['notes'] = rest
+                migrated = True
+        return migrated
+    
     def _save_credentials(self):
-        """Encrypt and save credentials to file"""
-        try:
-            # Convert credentials to JSON
-            json_data = json.dumps(self.credentials, indent=2)
-            
-            # Encrypt the data using master password
-            encrypted_data = self.crypto.encrypt_data(json_data, self.master_password)
-            
-            # Write encrypted data to file
-            with open(self.data_file, 'wb') as f:
-                f.write(encrypted_data)
-            
-            # Set secure permissions
-            os.chmod(self.data_file, 0o600)
+        """Encrypt and save credentials to file, or defer the save while inside batch()"""
+        self._statistics = None
+        if self._batch_depth:
+            self._dirty = True
             return True
+        return self.flush()
+    
+    @contextlib.contextmanager
+    def batch(self):
+        """Group several changes into a single encrypt-and-write when the block completes
         
-        except Exception as e:
-            raise Exception(f"Failed to save credentials: {e}")
+        If the block raises, nothing is written and the outermost batch reloads the
+        vault file, discarding the partially applied changes.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._dirty = False
+                self._load_credentials()
+            raise
+        self._batch_depth -= 1
+        if not self._batch_depth and self._dirty:
+            self.flush()
     
-    def add_credential(self, service, username, password, notes=""):
-        """Add a new credential"""
-        if service in self.credentials:
-            raise Exception(f"Service '{service}' already exists.")
+    @_wrap_errors("Failed to save credentials")
+    def flush(self):
+        """Encrypt and write credentials to file now"""
+        # Convert credentials to JSON
+        json_data = _dumps(self.credentials)
         
-        self.credentials[service] = {
-            "username": username,
-            "password": password,
-            "notes": notes,
-            "timestamp": datetime.now().isoformat()
-        }
-        self._save_credentials()
-        return True
-
-    def get_credential(self, service):
-        """Return a specific credential"""
-        return self.credentials.get(service)
-
-    def update_credential(self, service, username, password, notes=""):
-        """Update an existing credential"""
-        if service not in self.credentials:
-            raise Exception(f"Service '{service}' not found.")
+        # Encrypt the data with the session key, deriving it on the first save
+        if self._session_key is None:
+            self._session_key = self.crypto.derive_session_key(self.master_password)
         
-        self.credentials[service] = {
-            "username": username,
-            "password": password,
-            "notes": notes,
-            "timestamp": datetime.now().isoformat()
-        }
-        self._save_credentials()
+        # Encrypt straight into the file (created 0600, replaced atomically)
+        with _open_atomic(self.data_file) as f:
+            self.crypto.encrypt_stream(json_data, self._session_key, f)
+        self._dirty = False
         return True
-
-    def get_credential(self, service):
-        """Return a specific credential"""
-        return self.credentials.get(service)
-
-    def update_credential(self, service, username, password, notes=""):
-        """Update an existing credential"""
-        if service not in self.credentials:
-            raise Exception(f"Service '{service}' not found.")
-        
-        self.credentials[service] = {
-            "username": username,
-            "password": password,
-            "notes": notes,
-            "timestamp": datetime.now().isoformat()
-        }
-        self._save_credentials()
-        return True
-
-    def get_credential(self, service):
-        """Return a specific credential"""
-        return self.credentials.get(service)
-
-    def update_credential(self, service, username, password, notes=""):
-        """Update an existing credential"""
-        if service not in self.credentials:
-            raise Exception(f"Service '{service}' not found.")
+    
+    def add_credential(self, service, username, password, notes="", url=""):
+        """Add a new credential"""
+        canon = self._canon(service)
+        if canon in self._site_keys or canon in self._ambiguous_sites:
+            raise Exception(f"Service '{service}' already exists.")
         
+        self._site_keys[canon] = service
         self.credentials[service] = {
             "username": username,
             "password": password,
             "notes": notes,
+            "url": url,
             "timestamp": datetime.now().isoformat()
         }
         self._save_credentials()
@@ -196,144 +383,132 @@ class PasswordManager:
     
     def get_credential(self, site):
         """Retrieve a specific credential"""
-        try:
-            site_key = site.lower().strip()
-            return self.credentials.get(site_key)
-        except Exception as e:
-            raise Exception(f"Failed to retrieve credential: {e}")
+        return self.credentials.get(self._resolve_site(site))
     
     def get_all_credentials(self):
-        """Retrieve all credentials"""
-        try:
-            return self.credentials.copy()
-        except Exception as e:
-            raise Exception(f"Failed to retrieve credentials: {e}")
+        """Retrieve all credentials, as a live read-only view (no per-call copy)"""
+        return self._credentials_view
     
-    def update_credential(self, site, username=None, password=None, notes=None):
+    def list_credentials_meta(self):
+        """Retrieve a live read-only view of every credential without its password (for list views)"""
+        return _CredentialsMeta(self.credentials)
+    
+    @_wrap_errors("Failed to update credential")
+    def update_credential(self, site, username=None, password=None, notes=None, url=None):
         """Update an existing credential"""
-        try:
-            site_key = site.lower().strip()
-            
-            if site_key not in self.credentials:
-                return False
-            
-            credential = self.credentials[site_key]
-            
-            # Update only provided fields
-            if username is not None:
-                credential['username'] = username
-            if password is not None:
-                credential['password'] = password
-            if notes is not None:
-                credential['notes'] = notes
-            
-            credential['updated_at'] = datetime.now().isoformat()
-            
-            return self._save_credentials()
+        site_key = self._resolve_site(site)
         
-        except Exception as e:
-            raise Exception(f"Failed to update credential: {e}")
+        if site_key is None:
+            return False
+        
+        credential = self.credentials[site_key]
+        
+        # Update only provided fields that actually differ
+        changes = {
+            field: value
+            for field, value in (('username', username), ('password', password), ('notes', notes), ('url', url))
+            if value is not None and value != credential.get(field, '')
+        }
+        if not changes:
+            return True  # Saved unchanged; skip the re-encrypt and write
+        credential.update(changes)
+        
+        credential['updated_at'] = datetime.now().isoformat()
+        
+        return self._save_credentials()
     
+    @_wrap_errors("Failed to delete credential")
     def delete_credential(self, site):
         """Delete a credential"""
-        try:
-            site_key = site.lower().strip()
-            
-            if site_key not in self.credentials:
-                return False
-            
-            del self.credentials[site_key]
-            return self._save_credentials()
+        site_key = self._resolve_site(site)
         
-        except Exception as e:
-            raise Exception(f"Failed to delete credential: {e}")
+        if site_key is None:
+            return False
+        
+        del self.credentials[site_key]
+        canon = self._canon(site_key)
+        if canon in self._ambiguous_sites:
+            self._rebuild_site_index()  # The remaining spellings may now be unambiguous
+        else:
+            del self._site_keys[canon]
+        return self._save_credentials()
     
+    @_wrap_errors("Failed to change master password")
     def change_master_password(self, current_password, new_password):
         """Change the master password and re-encrypt all data"""
-        try:
-            # Verify current password
-            if not self.verify_master_password(current_password):
-                return False
-            
-            # Update master password hash
-            new_hash = self._hash_master_password(new_password)
-            with open(self.master_hash_file, 'w') as f:
-                f.write(new_hash)
-            
-            # Update master password and re-encrypt credentials
-            self.master_password = new_password
-            return self._save_credentials()
+        # Verify current password
+        if not self.verify_master_password(current_password):
+            return False
         
-        except Exception as e:
-            raise Exception(f"Failed to change master password: {e}")
+        # Update master password hash
+        self._write_master_hash(new_password)
+        
+        # Update master password and re-encrypt credentials under a new key
+        self.master_password = new_password
+        self._session_key = None
+        return self._save_credentials()
     
+    @_wrap_errors("Failed to export credentials")
     def export_credentials(self, filename):
         """Export credentials to an encrypted backup file"""
-        try:
-            if not self.credentials:
-                return False
-            
-            # Create export data with metadata
-            export_data = {
-                'exported_at': datetime.now().isoformat(),
-                'version': '1.0',
-                'credentials': self.credentials
-            }
-            
-            json_data = json.dumps(export_data, indent=2)
-            encrypted_data = self.crypto.encrypt_data(json_data, self.master_password)
-            
-            with open(filename, 'wb') as f:
-                f.write(encrypted_data)
-            
-            # Set secure permissions
-            os.chmod(filename, 0o600)
-            return True
+        if not self.credentials:
+            return False
         
-        except Exception as e:
-            raise Exception(f"Failed to export credentials: {e}")
+        # Create export data with metadata
+        export_data = {
+            'exported_at': datetime.now().isoformat(),
+            'version': '1.0',
+            'credentials': self.credentials
+        }
+        
+        json_data = _dumps(export_data)
+        
+        # Backups get their own salt; created 0600, replaced atomically
+        with _open_atomic(filename) as f:
+            self.crypto.encrypt_stream(json_data, self.crypto.derive_session_key(self.master_password), f)
+        return True
     
+    @_wrap_errors("Failed to import credentials")
     def import_credentials(self, filename, master_password):
         """Import credentials from an encrypted backup file"""
-        try:
-            if not os.path.exists(filename):
-                return False
-            
-            with open(filename, 'rb') as f:
-                encrypted_data = f.read()
-            
-            decrypted_data = self.crypto.decrypt_data(encrypted_data, master_password)
-            import_data = json.loads(decrypted_data)
-            
-            # Merge imported credentials (overwrite existing)
+        if not os.path.exists(filename):
+            return False
+        
+        with open(filename, 'rb') as f:
+            encrypted_data = f.read()
+        
+        decrypted_data = self.crypto.decrypt_data(encrypted_data, master_password)
+        import_data = _loads(decrypted_data)
+        
+        # Merge imported credentials (overwrite existing, whatever their case) as one save
+        with self.batch():
             if 'credentials' in import_data:
                 for site_key, credential in import_data['credentials'].items():
+                    site_key = self._resolve_site(site_key) or site_key
                     self.credentials[site_key] = credential
-            
-            return self._save_credentials()
-        
-        except Exception as e:
-            raise Exception(f"Failed to import credentials: {e}")
+                    self._index_site(site_key)
+                self._migrate_url_notes()
+            self._save_credentials()
+        return True
     
+    @_wrap_errors("Failed to get statistics")
     def get_statistics(self):
         """Get statistics about stored credentials"""
-        try:
+        if self._statistics is None:
             total_credentials = len(self.credentials)
-            sites_with_notes = sum(1 for cred in self.credentials.values() if cred.get('notes'))
+            sites_with_notes = weak_passwords = 0
             
-            # Password strength analysis
-            weak_passwords = 0
+            # Notes and password strength analysis in one pass
             for cred in self.credentials.values():
-                password = cred.get('password', '')
-                if len(password) < 8:
+                if cred.get('notes'):
+                    sites_with_notes += 1
+                if len(cred.get('password', '')) < 8:
                     weak_passwords += 1
             
-            return {
+            self._statistics = {
                 'total_credentials': total_credentials,
                 'sites_with_notes': sites_with_notes,
                 'weak_passwords': weak_passwords,
                 'strong_passwords': total_credentials - weak_passwords
             }
-        
-        except Exception as e:
-            raise Exception(f"Failed to get statistics: {e}")
+        return self._statistics.copy()